@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import csv
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+log = logging.getLogger(__name__)
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class AppliedStore:
+    """Indexed record of every job the bot has touched.
+
+    Backed by SQLite with one row per jobID holding the latest timestamp and
+    outcome, so membership checks are an index lookup instead of a scan of
+    the whole output CSV. The CSV is imported incrementally: the byte offset
+    reached on the last import is remembered and only the new tail is parsed.
+    """
+
+    def __init__(self, path: str = "applied.db") -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        # jobs taken by a worker in this process but not recorded yet
+        self.claimed: set = set()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS applied (
+                jobID TEXT PRIMARY KEY,
+                timestamp TEXT NOT NULL,
+                job TEXT,
+                company TEXT,
+                attempted INTEGER,
+                result INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS applied_timestamp ON applied (timestamp);
+            CREATE TABLE IF NOT EXISTS imports (
+                source TEXT PRIMARY KEY,
+                offset INTEGER NOT NULL
+            );
+        """)
+        self.conn.commit()
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM applied").fetchone()[0]
+
+    def __contains__(self, jobID) -> bool:
+        return self.has_applied(jobID)
+
+    def has_applied(self, jobID, within: timedelta | None = None) -> bool:
+        """True if jobID was recorded, optionally only within the given window"""
+        with self.lock:
+            row = self.conn.execute("SELECT timestamp FROM applied WHERE jobID = ?",
+                                    (str(jobID),)).fetchone()
+        if row is None:
+            return False
+        if within is None:
+            return True
+        return row[0] > (datetime.now() - within).strftime(TIMESTAMP_FORMAT)
+
+    def claim(self, jobID, within: timedelta | None = None) -> bool:
+        """Reserve jobID for the caller, False if it was applied to or claimed already"""
+        if self.has_applied(jobID, within):
+            return False
+        with self.lock:
+            if str(jobID) in self.claimed:
+                return False
+            self.claimed.add(str(jobID))
+            return True
+
+    def record(self, jobID, job=None, company=None, attempted=False, result=False,
+               timestamp: str | None = None) -> None:
+        if timestamp is None:
+            timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+        with self.lock:
+            self._upsert([(str(jobID), timestamp, job, company, int(bool(attempted)), int(bool(result)))])
+            self.conn.commit()
+
+    def import_csv(self, filename) -> int:
+        """Import rows appended to the output CSV since the last import"""
+        if not os.path.isfile(filename):
+            return 0
+        source: str = os.path.abspath(filename)
+        with self.lock:
+            row = self.conn.execute("SELECT offset FROM imports WHERE source = ?", (source,)).fetchone()
+            offset: int = row[0] if row else 0
+            if offset > os.path.getsize(filename):
+                # file was truncated or replaced, start over
+                offset = 0
+
+            rows: list = []
+            with open(filename, 'r', encoding='utf-8', newline='') as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith('\n'):
+                        # partial trailing row, pick it up next time
+                        break
+                    offset += len(line.encode('utf-8'))
+                    rows.extend(self._parse_rows(line))
+
+            self._upsert(rows)
+            self.conn.execute("INSERT OR REPLACE INTO imports (source, offset) VALUES (?, ?)", (source, offset))
+            self.conn.commit()
+        log.info(f"{len(rows)} rows imported from {filename}")
+        return len(rows)
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+    @staticmethod
+    def _parse_rows(line: str) -> list:
+        rows: list = []
+        for fields in csv.reader([line]):
+            if len(fields) < 2:
+                continue
+            try:
+                datetime.strptime(fields[0], TIMESTAMP_FORMAT)
+            except ValueError:
+                continue
+            fields += [None] * (6 - len(fields))
+            timestamp, jobID, job, company, attempted, result = fields[:6]
+            rows.append((jobID, timestamp, job, company,
+                         int(attempted == 'True'), int(result == 'True')))
+        return rows
+
+    def _upsert(self, rows: list) -> None:
+        self.conn.executemany("""
+            INSERT INTO applied (jobID, timestamp, job, company, attempted, result)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(jobID) DO UPDATE SET
+                timestamp = excluded.timestamp,
+                job = excluded.job,
+                company = excluded.company,
+                attempted = excluded.attempted,
+                result = excluded.result
+            WHERE excluded.timestamp >= applied.timestamp
+        """, rows)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+
+
+def write_json_atomic(path: str, data, private: bool = False) -> None:
+    """Write JSON to a temp file and rename it over path.
+
+    The temp file name is unique, so threads writing the same path never
+    replace or remove each other's half-written file. With `private` the
+    file is only readable by its owner.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory, prefix=f"{name}.",
+                                     suffix='.tmp', delete=False) as f:
+        try:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+            if not private:
+                # temp files are created owner-only
+                os.chmod(f.name, 0o644)
+        except BaseException:
+            f.close()
+            os.remove(f.name)
+            raise
+    os.replace(f.name, path)
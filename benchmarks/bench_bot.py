@@ -0,0 +1,90 @@
+"""End-to-end benchmark of the bot against the offline FakeLinkedIn site.
+
+Usage: python benchmarks/bench_bot.py [--results N] [--form-steps N] [--latency S] [--tabs K]
+
+Runs applications_loop for one search and send_resume on a single job with a
+FakeDriver, then reports jobs per minute, driver commands per job and wall
+time per stage as recorded by the bot's Metrics. Everything runs in a temporary directory so logs, qa.csv and
+output files do not touch the working tree.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+
+
+def make_bot(driver, workdir: Path, tabs: int = 0):
+    from easyapplybot import EasyApplyBot
+
+    resume = workdir / 'resume.pdf'
+    resume.write_bytes(b'%PDF-1.4\n')
+    return EasyApplyBot('user', 'password', '5550100', 30000, 16,
+                        uploads={'Resume': str(resume),
+                                 'resumes': [{'name': 'Default', 'path': str(resume), 'keywords': ['engineer']}]},
+                        filename=str(workdir / 'output.csv'),
+                        blacklist=['Senior', 'Java'],
+                        blackListTitles=[],
+                        browser=driver,
+                        tab_pool={'size': tabs})
+
+
+def report(label: str, elapsed: float, jobs: int, commands: int, stages: dict) -> None:
+    print(f"\n== {label} ==")
+    print(f"wall time        {elapsed:8.3f} s")
+    print(f"jobs processed   {jobs:8d}")
+    if jobs:
+        print(f"jobs per minute  {jobs / elapsed * 60:8.1f}")
+        print(f"commands per job {commands / jobs:8.1f}")
+    for name, stage in sorted(stages.items(), key=lambda item: -item[1]['sum']):
+        print(f"  {name:<24} {stage['count']:5d} calls {stage['sum']:8.3f} s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--results', type=int, default=100, help='results per search')
+    parser.add_argument('--form-steps', type=int, default=3)
+    parser.add_argument('--latency', type=float, default=0.0, help='simulated seconds per navigation')
+    parser.add_argument('--tabs', type=int, default=0, help='job pages preloaded in background tabs')
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix='easyapply-bench-'))
+    os.chdir(workdir)
+
+    from fake_linkedin import FakeDriver, FakeLinkedIn
+    from metrics import Metrics
+
+    site = FakeLinkedIn(results_per_search=args.results, form_steps=args.form_steps, latency=args.latency)
+    driver = FakeDriver(site)
+    bot = make_bot(driver, workdir, args.tabs)
+
+    driver.commands.clear()
+    start: float = time.perf_counter()
+    bot.applications_loop('Software engineer', 'Remote')
+    elapsed: float = time.perf_counter() - start
+    bot.sink.flush()
+    stages: dict = bot.metrics.summary()['stages']
+    jobs: int = stages.get('job', {}).get('count', 0)
+    report('applications_loop', elapsed, jobs, driver.command_count, stages)
+
+    bot.metrics = Metrics()
+    driver.get('https://www.linkedin.com/jobs/view/3900000001')
+    site.modal_step = 0
+    driver._load(driver.current_url, navigate=False)
+    driver.commands.clear()
+    start = time.perf_counter()
+    submitted: bool = bot.send_resume()
+    report(f'send_resume (submitted={submitted})', time.perf_counter() - start, 1, driver.command_count,
+           bot.metrics.summary()['stages'])
+    print("  commands: " + ", ".join(f"{k}={v}" for k, v in sorted(driver.commands.items())))
+
+
+if __name__ == '__main__':
+    main()
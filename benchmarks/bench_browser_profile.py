@@ -0,0 +1,148 @@
+"""Compare memory and page-load time of the standard and lean browser profiles.
+
+Usage: python benchmarks/bench_browser_profile.py [--pages N] [--url URL ...]
+
+Starts Chrome once with the options EasyApplyBot uses by default and once in
+lean mode, loads the same pages in both and reports the load time per page,
+the number of resources fetched and the resident memory of the whole Chrome
+process tree. Without --url a synthetic job page with images, web fonts and a
+video is served from a local HTTP server. Requires Chrome and chromedriver,
+memory is read from /proc so it is only reported on Linux.
+"""
+from __future__ import annotations
+
+import argparse
+import functools
+import http.server
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from selenium import webdriver
+
+from bot import EasyApplyBot
+from browser import BrowserManager
+
+JOB_PAGE = """<html><head><style>
+@font-face {{ font-family: Fake; src: url('font{i}.woff2'); }}
+body {{ font-family: Fake, sans-serif; }}
+</style></head><body>
+<h1 class="t-24 t-bold">Software Engineer {i}</h1>
+{images}
+<video src="clip{i}.mp4" autoplay muted></video>
+<script src="https://www.googletagmanager.com/gtm.js"></script>
+<button class="jobs-apply-button">Easy Apply</button>
+</body></html>
+"""
+
+TIMING_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+return [nav ? nav.loadEventEnd - nav.startTime : 0, performance.getEntriesByType('resource').length];
+"""
+
+
+def write_site(root: Path, pages: int) -> None:
+    blob: bytes = os.urandom(200_000)
+    for i in range(pages):
+        images: str = "".join(f"<img src='img{i}_{n}.png'>" for n in range(10))
+        (root / f"job{i}.html").write_text(JOB_PAGE.format(i=i, images=images))
+        for n in range(10):
+            (root / f"img{i}_{n}.png").write_bytes(blob)
+        (root / f"font{i}.woff2").write_bytes(blob)
+        (root / f"clip{i}.mp4").write_bytes(blob * 5)
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args) -> None:
+        pass
+
+
+def serve(root: Path) -> str:
+    handler = functools.partial(QuietHandler, directory=str(root))
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def tree_rss(pid: int) -> int:
+    """Resident memory in bytes of pid and all of its descendants"""
+    children: dict = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                parent = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(int(entry))
+
+    total, stack = 0, [pid]
+    while stack:
+        current: int = stack.pop()
+        stack.extend(children.get(current, []))
+        try:
+            with open(f'/proc/{current}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1]) * 1024
+        except OSError:
+            continue
+    return total
+
+
+def run(label: str, lean: bool, urls: list, profile_root: Path) -> None:
+    manager = BrowserManager(lean=lean)
+    # the same options the bot builds, without needing a bot instance
+    options = EasyApplyBot.browser_options(SimpleNamespace(browser_manager=manager),
+                                           str(profile_root / label))
+    start: float = time.perf_counter()
+    browser = webdriver.Chrome(options=options)
+    startup: float = time.perf_counter() - start
+    manager.prepare(browser)
+    try:
+        load_times, resources = [], 0
+        for url in urls:
+            browser.get(url)
+            load_ms, fetched = browser.execute_script(TIMING_SCRIPT)
+            load_times.append(load_ms)
+            resources += fetched
+        rss: int = tree_rss(browser.service.process.pid) if sys.platform.startswith('linux') else 0
+    finally:
+        browser.quit()
+
+    print(f"{label:<10} startup {startup:6.2f} s  "
+          f"load {sum(load_times) / len(load_times):8.1f} ms/page  "
+          f"{resources / len(urls):6.1f} resources/page  "
+          f"rss {rss / 2 ** 20:8.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--pages', type=int, default=10)
+    parser.add_argument('--url', action='append', help="page to load instead of the synthetic job pages")
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp())
+    # browser_options creates the profile relative to the working directory
+    os.chdir(root)
+    urls: list = args.url
+    if not urls:
+        site: Path = root / 'site'
+        site.mkdir()
+        write_site(site, args.pages)
+        base: str = serve(site)
+        urls = [f"{base}/job{i}.html" for i in range(args.pages)]
+
+    run("standard", False, urls, root)
+    run("lean", True, urls, root)
+
+
+if __name__ == '__main__':
+    main()
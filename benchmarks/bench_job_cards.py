@@ -0,0 +1,94 @@
+"""Count WebDriver commands needed to read one page of job cards.
+
+Usage: python benchmarks/bench_job_cards.py [--cards N]
+
+Serves a synthetic results page from a temporary file to headless Chrome and
+compares the old per-element reads in applications_loop with
+harvest_job_cards and parse_job_cards. Requires Chrome and chromedriver.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+
+from job_cards import harvest_job_cards, parse_job_cards
+
+CARD = """
+<div class="job-card-container" data-job-id="{id}">
+  <a class="job-card-container__link"><strong>Software Engineer {id}</strong></a>
+  <div class="artdeco-entity-lockup__subtitle">Company {id}</div>
+  <ul><li class="job-card-container__metadata-item">Remote</li></ul>
+  {applied}
+</div>
+"""
+
+
+class CommandCounter:
+    """Counts commands sent to chromedriver by wrapping WebDriver.execute"""
+
+    def __init__(self, browser) -> None:
+        self.count = 0
+        original = browser.execute
+
+        def execute(*args, **kwargs):
+            self.count += 1
+            return original(*args, **kwargs)
+
+        browser.execute = execute
+
+
+def legacy(browser) -> int:
+    locator = (By.CSS_SELECTOR, "div.job-card-container")
+    ids: dict = {}
+    if len(browser.find_elements(*locator)) > 0:
+        links = browser.find_elements(*locator) if len(browser.find_elements(*locator)) > 0 else []
+        for link in links:
+            hash(link.text)
+            if 'Applied' not in link.text:
+                ids[link.get_attribute("data-job-id")] = "To be processed"
+    return len(ids)
+
+
+def measure(label: str, counter: CommandCounter, fn) -> None:
+    counter.count = 0
+    start: float = time.perf_counter()
+    found = fn()
+    elapsed: float = time.perf_counter() - start
+    print(f"{label:<20} {counter.count:5d} commands  {elapsed * 1000:8.1f} ms  {found} jobs")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--cards', type=int, default=25)
+    args = parser.parse_args()
+
+    cards: str = "".join(CARD.format(id=3_900_000_000 + i, applied="<span>Applied</span>" if i % 5 == 0 else "")
+                         for i in range(args.cards))
+    page = Path(tempfile.mkdtemp()) / "search.html"
+    page.write_text(f"<html><body><div class='jobs-search-results-list'>{cards}</div></body></html>")
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    browser = webdriver.Chrome(options=options)
+    try:
+        browser.get(page.as_uri())
+        counter = CommandCounter(browser)
+        measure("legacy", counter, lambda: legacy(browser))
+        measure("harvest_job_cards", counter,
+                lambda: len([c for c in harvest_job_cards(browser) if not c.applied]))
+        measure("parse_job_cards", counter,
+                lambda: len([c for c in parse_job_cards(browser.page_source) if not c.applied]))
+    finally:
+        browser.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Discovery throughput of the guest API JobSource against a local fixture server.
+
+Usage: python benchmarks/bench_job_source.py [--results N] [--latency S]
+
+Serves FakeLinkedIn's guest search fragments over HTTP on localhost, with an
+optional delay per request, and pages through one search with
+GuestJobSource until it runs out of results. Reports pages and cards per
+second and checks every card came back with an id, title and company.
+"""
+from __future__ import annotations
+
+import argparse
+import http.server
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+
+from fake_linkedin import FakeLinkedIn
+from job_source import PAGE_SIZE, GuestJobSource
+
+
+def serve(site: FakeLinkedIn) -> tuple:
+    """Start the fixture server, returns (server, guest search url)"""
+
+    class GuestHandler(http.server.BaseHTTPRequestHandler):
+        # keep-alive, so the pooled session is actually reused
+        protocol_version = "HTTP/1.1"
+        # headers and body go out in separate writes, Nagle would delay the body
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            time.sleep(site.latency)
+            body: bytes = site.render_guest(parse_qs(urlparse(self.path).query)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), GuestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/jobs-guest/jobs/api/seeMoreJobPostings/search"
+    return server, url
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--results', type=int, default=1000)
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds the server waits per request")
+    args = parser.parse_args()
+
+    site = FakeLinkedIn(results_per_search=args.results, latency=args.latency)
+    server, url = serve(site)
+    source = GuestJobSource(url=url)
+    try:
+        pages, cards, start = 0, [], 0
+        began: float = time.perf_counter()
+        while True:
+            page: list = source.search("Software Engineer", "Remote", start)
+            if not page:
+                break
+            pages += 1
+            cards.extend(page)
+            start += PAGE_SIZE
+        elapsed: float = time.perf_counter() - began
+    finally:
+        source.close()
+        server.shutdown()
+
+    complete: int = sum(1 for card in cards if card.job_id and card.title and card.company)
+    print(f"pages           {pages:8d}")
+    print(f"cards           {len(cards):8d} ({complete} complete)")
+    print(f"wall time       {elapsed:8.3f} s")
+    print(f"pages per second {pages / elapsed:7.1f}")
+    print(f"cards per second {len(cards) / elapsed:7.1f}")
+    if len(cards) != args.results or complete != len(cards):
+        sys.exit(f"expected {args.results} complete cards")
+
+
+if __name__ == '__main__':
+    main()
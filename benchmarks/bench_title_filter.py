@@ -0,0 +1,72 @@
+"""Micro-benchmark for TitleFilter against the old per-pattern re.search loop.
+
+Usage: python benchmarks/bench_title_filter.py [output.csv] [--titles N] [--keywords N]
+
+Titles are taken from the job column of an output CSV (repeated and shuffled
+up to --titles), and the blacklist is padded with synthetic keywords to show
+how both approaches scale with the number of configured entries.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import random
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from title_filter import DEFAULT_KEYWORDS, DEFAULT_PATTERNS, TitleFilter
+
+
+def load_titles(filename: str, count: int) -> list:
+    titles: list = []
+    with open(filename, encoding='utf-8') as f:
+        for row in csv.reader(f):
+            if len(row) > 2 and row[2]:
+                titles.append(row[2])
+    if not titles:
+        raise SystemExit(f"No job titles found in {filename}")
+    return [random.choice(titles) for _ in range(count)]
+
+
+def legacy_match(title: str, patterns: list) -> bool:
+    title_lower = title.lower()
+    return any(re.search(pattern, title_lower) for pattern in patterns)
+
+
+def timed(label: str, fn, titles: list) -> float:
+    start: float = time.perf_counter()
+    hits = sum(1 for title in titles if fn(title))
+    elapsed: float = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.3f}s  {len(titles) / elapsed:12,.0f} titles/s  {hits} hits")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('csv', nargs='?', default='out.csv')
+    parser.add_argument('--titles', type=int, default=300_000)
+    parser.add_argument('--keywords', type=int, default=500)
+    args = parser.parse_args()
+
+    random.seed(0)
+    titles: list = load_titles(args.csv, args.titles)
+    keywords: list = DEFAULT_KEYWORDS + [''.join(random.choices(string.ascii_lowercase, k=8))
+                                         for _ in range(args.keywords - len(DEFAULT_KEYWORDS))]
+    legacy_patterns: list = [rf'\b{k}\b' for k in keywords] + DEFAULT_PATTERNS
+
+    print(f"{len(titles)} titles, {len(keywords)} keywords, {len(DEFAULT_PATTERNS)} patterns")
+    title_filter = TitleFilter(keywords, DEFAULT_PATTERNS)
+    timed("re.search per pattern", lambda t: legacy_match(t, legacy_patterns), titles)
+    timed("TitleFilter.match", title_filter.match, titles)
+    start: float = time.perf_counter()
+    title_filter.match_many(titles)
+    print(f"{'TitleFilter.match_many':<28} {time.perf_counter() - start:8.3f}s")
+
+
+if __name__ == '__main__':
+    main()
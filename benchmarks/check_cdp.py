@@ -0,0 +1,132 @@
+"""End-to-end check of the cdp browser backend against a local headless Chrome.
+
+Usage: python benchmarks/check_cdp.py [--port PORT]
+
+Serves FakeLinkedIn search and job pages from the fixture server of
+bench_browser_profile.py, starts Chrome through BrowserManager with
+`backend='cdp'` and drives it with CDPDriver: navigation, title and page
+source, element lookup by every locator the bot uses, clicks, sync and async
+scripts, cookies, and preloading and switching tabs the way TabPool does.
+Exits 0 without running when Chrome or websockets is not installed.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from selenium.webdriver.common.by import By
+
+from bench_browser_profile import serve
+from bot import EasyApplyBot
+from browser import CHROME_BINARIES, BrowserManager
+from fake_linkedin import FakeLinkedIn
+from waiter import Waiter
+
+JOB_IDS = ["3900000001", "3900000002", "3900000003"]
+
+
+def write_site(root: Path, site: FakeLinkedIn) -> None:
+    pages: dict = {f"jobs/view/{job_id}/index.html": f"https://www.linkedin.com/jobs/view/{job_id}"
+                   for job_id in JOB_IDS}
+    pages["jobs/search/index.html"] = "https://www.linkedin.com/jobs/search/?keywords=Engineer&location=Remote"
+    for path, url in pages.items():
+        title, source = site.render(url)
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text(source.replace("<html>", f"<html><head><title>{title}</title></head>", 1))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--port', type=int, default=0, help="remote debugging port, a free one by default")
+    args = parser.parse_args()
+
+    if not any(map(shutil.which, CHROME_BINARIES)) or importlib.util.find_spec('websockets') is None:
+        print("skipped: needs Chrome and the websockets package")
+        return 0
+
+    root = Path(tempfile.mkdtemp(prefix='easyapply-cdp-'))
+    os.chdir(root)
+    site_dir: Path = root / 'site'
+    write_site(site_dir, FakeLinkedIn())
+    base: str = serve(site_dir)
+
+    manager = BrowserManager(backend='cdp', lean=True, debugger_port=args.port or free_port())
+    options = EasyApplyBot.browser_options(SimpleNamespace(browser_manager=manager), str(root / 'profile'))
+    failures: list = []
+
+    def check(name: str, ok) -> None:
+        print(f"{'ok  ' if ok else 'FAIL'} {name}")
+        if not ok:
+            failures.append(name)
+
+    browser = manager.start(options, str(root / 'profile'))
+    try:
+        start: float = time.perf_counter()
+        browser.get(f"{base}/jobs/search/")
+        check("get and current_url", browser.current_url.startswith(f"{base}/jobs/search"))
+        check("title", browser.title.endswith("| LinkedIn"))
+        check("page_source", 'job-card-container' in browser.page_source)
+        cards: list = browser.find_elements(By.CSS_SELECTOR, 'div.job-card-container')
+        check("find_elements by css", len(cards) == 25)
+        check("find_element by class name",
+              browser.find_element(By.CLASS_NAME, 'jobs-search-results-list').tag_name == 'div')
+        check("get_attribute", cards[0].get_attribute('data-job-id').isdigit())
+        check("nested find_element", cards[0].find_element(By.TAG_NAME, 'strong').text != '')
+
+        browser.get(f"{base}/jobs/view/{JOB_IDS[0]}/")
+        title = browser.find_element(By.XPATH, '//h1[contains(@class, "job-title")]')
+        check("find_element by xpath", title.text in browser.title)
+        browser.execute_script("document.querySelector('h1').addEventListener('click', e => "
+                               "e.target.setAttribute('data-clicked', 'yes'))")
+        title.click()
+        check("click", title.get_attribute('data-clicked') == 'yes')
+        check("execute_script with arguments", browser.execute_script("return arguments[0] + arguments[1]", 2, 3) == 5)
+        check("execute_script with an element", browser.execute_script("return arguments[0].tagName", title) == 'H1')
+        check("execute_async_script",
+              browser.execute_async_script("const done = arguments[arguments.length - 1]; "
+                                           "setTimeout(() => done(arguments[0] * 2), 50)", 21) == 42)
+        check("waiter.quiet", Waiter(browser, timeout=5).quiet("check_cdp", quiet=0.2))
+
+        browser.add_cookie({"name": "li_at", "value": "token", "domain": "127.0.0.1", "path": "/",
+                            "session": True, "expires": -1})
+        check("session cookie survives add_cookie",
+              any(cookie["name"] == "li_at" for cookie in browser.get_cookies()))
+
+        # what TabPool.preload and TabPool.take do
+        home: str = browser.current_window_handle
+        target: dict = browser.execute_cdp_cmd("Target.createTarget",
+                                               {"url": f"{base}/jobs/view/{JOB_IDS[1]}/", "background": True})
+        handle = next((h for h in browser.window_handles if h.endswith(target["targetId"])), None)
+        check("background tab in window_handles", handle is not None)
+        browser.close()
+        browser.switch_to.window(handle)
+        check("switch to preloaded tab", browser.current_url.endswith(f"/jobs/view/{JOB_IDS[1]}/"))
+        check("previous tab closed", home not in browser.window_handles)
+        print(f"checks took {time.perf_counter() - start:.2f} s")
+    finally:
+        browser.quit()
+        for host in BrowserManager.hosts.values():
+            host.close()
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
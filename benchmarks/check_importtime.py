@@ -0,0 +1,50 @@
+"""Import-time budget for the command line entry point.
+
+Usage: python benchmarks/check_importtime.py [--config FILE] [--budget MS]
+
+Runs `python -X importtime easyapplybot.py --check-config` and fails if the
+summed import time exceeds the budget or if any heavy dependency that is
+only needed for a real run gets imported.
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+HEAVY = ('selenium', 'webdriver_manager', 'pandas', 'pyautogui', 'bs4', 'lxml', 'requests')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--config', default=str(ROOT / 'config.example.yaml'))
+    parser.add_argument('--budget', type=float, default=100.0, help="milliseconds")
+    args = parser.parse_args()
+
+    result = subprocess.run([sys.executable, '-X', 'importtime', str(ROOT / 'easyapplybot.py'),
+                             '--check-config', '--config', args.config],
+                            cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(result.stdout + result.stderr)
+        return result.returncode
+
+    total_us = 0
+    imported: list = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        total_us += int(self_us)
+        imported.append(name.strip())
+
+    heavy: list = sorted({name for name in imported if name.split('.')[0] in HEAVY})
+    print(f"--check-config imported {len(imported)} modules in {total_us / 1000:.1f} ms (budget {args.budget} ms)")
+    if heavy:
+        print("heavy modules imported: " + ", ".join(heavy))
+    return 1 if heavy or total_us / 1000 > args.budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
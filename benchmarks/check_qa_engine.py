@@ -0,0 +1,42 @@
+"""Near-duplicate matching checks for QAEngine.
+
+Usage: python benchmarks/check_qa_engine.py
+
+Looks up question pairs against a single known answer and fails if a
+question that asks about something else borrows that answer, or if a
+rewording of the same question misses it.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from qa_engine import QAEngine
+
+KNOWN = "How many years of work experience do you have with Java?"
+# (question, whether it should get KNOWN's answer)
+CASES = [
+    ("how many years of work experience do you have with python?", False),
+    ("How many years of work experience do you have with Java?", True),
+    ("How many years of work experience have you with Java", True),
+    ("How many years of total work experience do you have with Java?", True),
+    ("How many years of work experience do you have with Java and Spring?", False),
+]
+
+
+def main() -> int:
+    failed = 0
+    for question, matches in CASES:
+        engine = QAEngine({KNOWN: "7"})
+        answer = engine.lookup(question)
+        ok: bool = (answer == "7") == matches
+        failed += not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {question!r} -> {answer!r}"
+              f" ({'should' if matches else 'must not'} match the known answer)")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
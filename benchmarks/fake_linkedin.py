@@ -0,0 +1,508 @@
+"""Offline stand-in for LinkedIn and the WebDriver subset the bot uses.
+
+FakeLinkedIn renders synthetic search result pages, job view pages and a
+multi-step Easy Apply modal using the same classes, ids and aria-labels the
+bot's locators look for. FakeDriver serves those pages from memory through
+the find_element(s)/get/execute_script surface of a Selenium WebDriver and
+counts every command, so whole flows can be timed without a browser.
+
+Scripts the bot sends are recognised by identity; anything unknown is counted
+and returns None.
+"""
+from __future__ import annotations
+
+import hashlib
+import itertools
+import re
+import sys
+import time
+from dataclasses import asdict
+from types import SimpleNamespace
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lxml import html as lxml_html
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from form_steps import CLICK_SCRIPT, FIELDS_SCRIPT, FILL_SCRIPT, SNAPSHOT_SCRIPT
+from job_cards import HARVEST_SCRIPT, RESULT_COUNT_SCRIPT, parse_job_cards
+from selector_resolver import PROBE_SCRIPT
+from waiter import NETWORK_IDLE_SCRIPT, QUIET_SCRIPT, SCROLL_SCRIPT
+
+TITLES = ["Software Engineer", "Senior Software Engineer", "Data Analyst", "Backend Developer",
+          "Java Developer", "Python Engineer", "Full Stack Engineer", "Platform Engineer"]
+COMPANIES = ["Acme", "Initech", "Globex", "Umbrella", "Hooli", "Stark Industries"]
+
+
+def css_to_xpath(selector: str) -> str:
+    """Translate the small CSS subset used by the bot into XPath"""
+    token = re.compile(r"([#.]?[\w-]+|\*|\[[^\]]+\])")
+    paths: list = []
+    for group in selector.split(','):
+        steps: list = []
+        # attribute values may contain spaces, only split outside of brackets
+        for compound in re.findall(r"(?:[^\s\[]|\[[^\]]*\])+", group):
+            tag, predicates = '*', []
+            for part in token.findall(compound):
+                if part.startswith('#'):
+                    predicates.append(f"@id='{part[1:]}'")
+                elif part.startswith('.'):
+                    predicates.append(f"contains(concat(' ', normalize-space(@class), ' '), ' {part[1:]} ')")
+                elif part.startswith('['):
+                    name, _, value = part[1:-1].partition('=')
+                    value = value.strip('\'"')
+                    if name.endswith('*'):
+                        predicates.append(f"contains(@{name[:-1]}, '{value}')")
+                    else:
+                        predicates.append(f"@{name}='{value}'" if _ else f"@{name}")
+                else:
+                    tag = part
+            steps.append(tag + ''.join(f'[{p}]' for p in predicates))
+        paths.append('.//' + '//'.join(steps))
+    return ' | '.join(paths)
+
+
+def to_xpath(by: str, value: str) -> str:
+    if by == By.XPATH:
+        return '.' + value if value.startswith('/') else value
+    if by == By.CSS_SELECTOR:
+        return css_to_xpath(value)
+    if by == By.CLASS_NAME:
+        return css_to_xpath('.' + value)
+    if by == By.ID:
+        return f".//*[@id='{value}']"
+    if by == By.NAME:
+        return f".//*[@name='{value}']"
+    if by == By.TAG_NAME:
+        return f".//{value}"
+    raise ValueError(f"Unsupported locator strategy {by}")
+
+
+class FakeElement(WebElement):
+
+    def __init__(self, driver: FakeDriver, node) -> None:
+        self._driver = driver
+        self._node = node
+        self._id = str(id(node))
+
+    @property
+    def text(self) -> str:
+        self._driver.count('text')
+        return ' '.join(self._node.text_content().split())
+
+    @property
+    def tag_name(self) -> str:
+        return self._node.tag
+
+    def get_attribute(self, name: str):
+        self._driver.count('get_attribute')
+        return self._node.get(name)
+
+    def is_displayed(self) -> bool:
+        self._driver.count('is_displayed')
+        return True
+
+    def is_enabled(self) -> bool:
+        self._driver.count('is_enabled')
+        return self._node.get('disabled') is None
+
+    def click(self) -> None:
+        self._driver.count('click')
+        self._driver.site.click(self._driver, self._node)
+
+    def clear(self) -> None:
+        self._driver.count('clear')
+        self._node.set('value', '')
+
+    def send_keys(self, *value) -> None:
+        self._driver.count('send_keys')
+        self._node.set('value', (self._node.get('value') or '') + ''.join(map(str, value)))
+
+    def find_element(self, by=By.ID, value=None):
+        return self._driver._find(self._node, by, value, single=True)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._driver._find(self._node, by, value)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, FakeElement) and other._node is self._node
+
+    def __hash__(self) -> int:
+        return hash(self._id)
+
+
+class FakeLinkedIn:
+    """Synthetic site state: search results, job pages and the apply modal"""
+
+    def __init__(self, results_per_search: int = 100, easy_apply_ratio: float = 0.8,
+                 applied_ratio: float = 0.1, form_steps: int = 3, latency: float = 0.0) -> None:
+        self.results_per_search = results_per_search
+        self.easy_apply_ratio = easy_apply_ratio
+        self.applied_ratio = applied_ratio
+        self.form_steps = max(1, form_steps)
+        self.latency = latency
+        self.modal_step: int | None = None
+        self.submitted: set = set()
+        self.job_id: str | None = None
+
+    @staticmethod
+    def _hash(*parts) -> int:
+        return int(hashlib.md5('|'.join(map(str, parts)).encode()).hexdigest()[:8], 16)
+
+    def job(self, job_id: str) -> dict:
+        h: int = self._hash(job_id)
+        return {
+            "id": job_id,
+            "title": TITLES[h % len(TITLES)],
+            "company": COMPANIES[h // 7 % len(COMPANIES)],
+            "easy_apply": (h % 100) < self.easy_apply_ratio * 100,
+            "applied": (h // 3 % 100) < self.applied_ratio * 100 or job_id in self.submitted,
+        }
+
+    def render(self, url: str) -> tuple:
+        """Return (title, html) for url"""
+        parsed = urlparse(url)
+        if parsed.path.startswith('/jobs/search'):
+            return self.render_search(parse_qs(parsed.query))
+        if parsed.path.startswith('/jobs-guest/'):
+            return "", self.render_guest(parse_qs(parsed.query))
+        match = re.match(r'/jobs/view/(\d+)', parsed.path)
+        if match:
+            return self.render_job(match.group(1))
+        if parsed.path.startswith('/feed'):
+            return "Feed | LinkedIn", "<html><body><main>feed</main></body></html>"
+        return "LinkedIn", "<html><body></body></html>"
+
+    def search_ids(self, query: dict) -> list:
+        keywords: str = query.get('keywords', [''])[0]
+        location: str = query.get('location', [''])[0]
+        start: int = int(query.get('start', ['0'])[0])
+        # overlapping searches share part of their ids
+        return [str(3_900_000_000 + self._hash(keywords, index % 40 if index % 3 else location, index) % 10_000_000)
+                for index in range(start, min(start + 25, self.results_per_search))]
+
+    def render_search(self, query: dict) -> tuple:
+        keywords: str = query.get('keywords', [''])[0]
+        location: str = query.get('location', [''])[0]
+        cards: list = []
+        for job_id in self.search_ids(query):
+            job = self.job(job_id)
+            cards.append(f"""
+            <li><div class="job-card-container" data-job-id="{job_id}">
+              <a class="job-card-container__link"><strong>{job['title']}</strong></a>
+              <div class="artdeco-entity-lockup__subtitle">{job['company']}</div>
+              <ul><li class="job-card-container__metadata-item">{location}</li></ul>
+              {'<span>Applied</span>' if job['applied'] else ''}
+            </div></li>""")
+        body: str = f"""
+        <div class="jobs-search-results-list__subtitle"><span>{self.results_per_search} results</span></div>
+        <div class="jobs-search-results-list"><ul>{''.join(cards)}</ul></div>"""
+        return f"{keywords} jobs in {location} | LinkedIn", f"<html><body>{body}</body></html>"
+
+    def render_guest(self, query: dict) -> str:
+        """<li> fragment of the logged-out search API, empty past the last result"""
+        location: str = query.get('location', [''])[0]
+        cards: list = []
+        for job_id in self.search_ids(query):
+            job = self.job(job_id)
+            cards.append(f"""
+            <li><div class="base-card job-search-card" data-entity-urn="urn:li:jobPosting:{job_id}">
+              <div class="base-search-card__info">
+                <h3 class="base-search-card__title">{job['title']}</h3>
+                <h4 class="base-search-card__subtitle"><a>{job['company']}</a></h4>
+                <div class="base-search-card__metadata"><span class="job-search-card__location">{location}</span></div>
+              </div>
+            </div></li>""")
+        return ''.join(cards)
+
+    def render_job(self, job_id: str) -> tuple:
+        self.job_id = job_id
+        job = self.job(job_id)
+        button = '<button class="jobs-apply-button artdeco-button">Easy Apply</button>' \
+            if job['easy_apply'] and not job['applied'] else ''
+        applied = '<span>You applied on 1/1/2026</span>' if job['applied'] else ''
+        modal: str = self.render_modal() if self.modal_step is not None else ''
+        body: str = f"""
+        <div class="jobs-unified-top-card">
+          <h1 class="jobs-unified-top-card__job-title job-details-jobs-unified-top-card__job-title t-24">{job['title']}</h1>
+          <div class="jobs-unified-top-card__company-name">{job['company']}</div>
+          {button}{applied}
+        </div>{modal}"""
+        return f"{job['title']} | {job['company']} | LinkedIn", f"<html><body>{body}</body></html>"
+
+    def render_modal(self) -> str:
+        step: int = self.modal_step
+        if step >= self.form_steps + 1:
+            return '<div class="jobs-easy-apply-modal"><h3>Your application was sent</h3></div>'
+        fields: str = ''
+        if step == 0:
+            fields = """
+            <div class="jobs-easy-apply-form-section__grouping">
+              <label>Mobile phone number</label><input class="artdeco-text-input--input" type="text"/>
+            </div>"""
+        elif step == 1:
+            fields = """
+            <span>Upload resume</span>
+            <input type="file" name="file" id="jobs-document-upload-file-input-upload-resume"/>"""
+        else:
+            fields = """
+            <div class="jobs-easy-apply-form-section__grouping">
+              <label>How many years of experience do you have with Python?</label>
+              <input class="artdeco-text-input--input" type="text"/>
+            </div>
+            <div class="jobs-easy-apply-form-section__grouping">
+              <label>Do you require visa sponsorship?</label>
+              <input type="radio" name="visa" value="Yes"/><input type="radio" name="visa" value="No"/>
+            </div>"""
+        if step < self.form_steps - 1:
+            action = "Continue to next step"
+        elif step == self.form_steps - 1:
+            action = "Review your application"
+        else:
+            action = "Submit application"
+        return f"""
+        <div class="jobs-easy-apply-modal" role="dialog">{fields}
+          <label for="follow-company-checkbox">Follow</label>
+          <button aria-label="{action}">{action.split()[0]}</button>
+        </div>"""
+
+    def click(self, driver: FakeDriver, node) -> None:
+        label: str = node.get('aria-label') or ''
+        if 'jobs-apply-button' in (node.get('class') or ''):
+            self.modal_step = 0
+        elif label in ("Continue to next step", "Review your application"):
+            self.modal_step += 1
+        elif label == "Submit application":
+            self.modal_step = self.form_steps + 1
+            self.submitted.add(self.job_id)
+        else:
+            return
+        driver._load(driver.current_url, navigate=False)
+
+
+class FakeDriver:
+    """WebDriver look-alike serving FakeLinkedIn pages, counting each command"""
+
+    def __init__(self, site: FakeLinkedIn | None = None) -> None:
+        self.site = site or FakeLinkedIn()
+        self.current_url: str = "about:blank"
+        self.title: str = ""
+        self.dom = lxml_html.fromstring("<html><body></body></html>")
+        self.commands: dict = {}
+        self.cookies: list = []
+        # background tabs opened through Target.createTarget: handle -> (url, time it finishes loading)
+        self.tabs: dict = {}
+        self.tab_ids = itertools.count(1)
+        self.current_window_handle: str = "tab-0"
+
+    def count(self, name: str) -> None:
+        self.commands[name] = self.commands.get(name, 0) + 1
+
+    @property
+    def command_count(self) -> int:
+        return sum(self.commands.values())
+
+    def _load(self, url: str, navigate: bool = True) -> None:
+        if navigate:
+            self.site.modal_step = None
+            time.sleep(self.site.latency)
+        self.current_url = url
+        self.title, source = self.site.render(url)
+        self.dom = lxml_html.fromstring(source)
+
+    def get(self, url: str) -> None:
+        self.count('get')
+        self._load(url)
+
+    def refresh(self) -> None:
+        self.count('refresh')
+        self._load(self.current_url)
+
+    @property
+    def page_source(self) -> str:
+        self.count('page_source')
+        return f"<html><head><title>{self.title}</title></head>" + \
+            lxml_html.tostring(self.dom.body, encoding='unicode') + "</html>"
+
+    def _find(self, root, by, value, single: bool = False):
+        self.count('find_element' if single else 'find_elements')
+        nodes: list = root.xpath(to_xpath(by, value))
+        if single:
+            if not nodes:
+                raise NoSuchElementException(f"{by}={value}")
+            return FakeElement(self, nodes[0])
+        return [FakeElement(self, node) for node in nodes]
+
+    def find_element(self, by=By.ID, value=None):
+        return self._find(self.dom, by, value, single=True)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._find(self.dom, by, value)
+
+    def execute_script(self, script: str, *args):
+        self.count('execute_script')
+        if script is HARVEST_SCRIPT:
+            return [asdict(card) for card in parse_job_cards(self.page_source, args[0])]
+        if script is RESULT_COUNT_SCRIPT:
+            for selector in args[0]:
+                nodes: list = self.dom.xpath(css_to_xpath(selector))
+                if nodes:
+                    return nodes[0].text_content()
+            return None
+        if script is PROBE_SCRIPT:
+            for index, selector in enumerate(args[0]):
+                nodes: list = self.dom.xpath(css_to_xpath(selector))
+                text: str = ' '.join(nodes[0].text_content().split()) if nodes else ''
+                if text:
+                    return [index, text]
+            return None
+        if script is SNAPSHOT_SCRIPT:
+            return self._snapshot(*args)
+        if script is FIELDS_SCRIPT:
+            return self._fields(*args)
+        if script is FILL_SCRIPT:
+            return self._fill(*args)
+        if script is CLICK_SCRIPT:
+            nodes: list = self.dom.xpath(css_to_xpath(args[0]))
+            if nodes:
+                self.site.click(self, nodes[0])
+            return bool(nodes)
+        if 'document.readyState' in script:
+            return "complete"
+        if 'arguments[0].click()' in script:
+            args[0].click()
+        return None
+
+    def _snapshot(self, modal, buttons, grouping, error, resume, cover_letter) -> dict:
+        modals: list = self.dom.xpath(css_to_xpath(modal))
+        root = modals[0] if modals else self.dom
+        text: str = ' '.join(root.text_content().split())
+
+        def empty(group) -> bool:
+            radios: list = group.xpath(".//input[@type='radio']")
+            if radios:
+                return not any(radio.get('checked') is not None for radio in radios)
+            inputs: list = group.xpath(".//input[not(@type='file') and not(@type='checkbox')] | .//textarea | .//select")
+            return bool(inputs) and not inputs[0].get('value')
+
+        return {
+            "open": bool(modals),
+            "buttons": {name: bool(root.xpath(css_to_xpath(selector))) for name, selector in buttons.items()},
+            "upload_resume": bool(root.xpath(css_to_xpath(resume))) and 'upload resume' in text.lower(),
+            "upload_cover_letter": bool(root.xpath(css_to_xpath(cover_letter))),
+            "errors": [' '.join(node.text_content().split()) for node in root.xpath(css_to_xpath(error))],
+            "empty_fields": sum(1 for group in root.xpath(css_to_xpath(grouping)) if empty(group)),
+            "sent": 'application was sent' in text.lower(),
+        }
+
+    def _groupings(self, modal, grouping) -> list:
+        modals: list = self.dom.xpath(css_to_xpath(modal))
+        return (modals[0] if modals else self.dom).xpath(css_to_xpath(grouping))
+
+    def _fields(self, modal, grouping) -> list:
+        fields: list = []
+        for index, group in enumerate(self._groupings(modal, grouping)):
+            labels: list = group.xpath(".//legend | .//label")
+            radios: list = group.xpath(".//input[@type='radio']")
+            inputs: list = group.xpath(".//input[not(@type='file') and not(@type='checkbox') and not(@type='radio')]"
+                                       " | .//textarea")
+            field: dict = {"index": index, "label": ' '.join((labels[0] if labels else group).text_content().split()),
+                           "type": "other", "options": [], "value": ""}
+            if radios:
+                checked: list = [radio.get('value') for radio in radios if radio.get('checked') is not None]
+                field.update(type="radio", options=[radio.get('value') for radio in radios],
+                             value=checked[0] if checked else "")
+            elif inputs:
+                field.update(type="text", value=inputs[0].get('value') or "")
+            fields.append(field)
+        return fields
+
+    def _fill(self, modal, grouping, values: dict) -> list:
+        groups: list = self._groupings(modal, grouping)
+        missed: list = []
+        for index, value in values.items():
+            group = groups[int(index)] if int(index) < len(groups) else None
+            radios: list = group.xpath(".//input[@type='radio']") if group is not None else []
+            inputs: list = group.xpath(".//input[not(@type='file') and not(@type='checkbox') and "
+                                       "not(@type='radio')] | .//textarea") if group is not None else []
+            if radios:
+                match: list = [radio for radio in radios if radio.get('value', '').lower() == value.strip().lower()]
+                if match:
+                    match[0].set('checked', 'checked')
+                else:
+                    missed.append(int(index))
+            elif inputs:
+                inputs[0].set('value', value)
+            else:
+                missed.append(int(index))
+        return missed
+
+    def execute_async_script(self, script: str, *args):
+        self.count('execute_async_script')
+        if script is QUIET_SCRIPT or script is NETWORK_IDLE_SCRIPT:
+            return True
+        if script is SCROLL_SCRIPT:
+            return [len(self.dom.xpath(css_to_xpath(args[0]))), True]
+        return None
+
+    def set_script_timeout(self, timeout) -> None:
+        pass
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict):
+        self.count('execute_cdp_cmd')
+        if cmd == "Target.createTarget":
+            # the page loads on its own clock while the foreground tab keeps working
+            handle: str = f"tab-{next(self.tab_ids)}"
+            self.tabs[handle] = (cmd_args["url"], time.perf_counter() + self.site.latency)
+            return {"targetId": handle}
+        if cmd == "Target.closeTarget":
+            self.tabs.pop(cmd_args["targetId"], None)
+        return {}
+
+    @property
+    def window_handles(self) -> list:
+        self.count('window_handles')
+        return [self.current_window_handle, *self.tabs]
+
+    @property
+    def switch_to(self) -> SimpleNamespace:
+        return SimpleNamespace(window=self._switch_to_window)
+
+    def _switch_to_window(self, handle: str) -> None:
+        self.count('switch_to_window')
+        url, ready = self.tabs.pop(handle)
+        time.sleep(max(0.0, ready - time.perf_counter()))
+        self.current_window_handle = handle
+        self.site.modal_step = None
+        self._load(url, navigate=False)
+
+    def close(self) -> None:
+        self.count('close')
+
+    def get_cookies(self) -> list:
+        self.count('get_cookies')
+        return list(self.cookies)
+
+    def add_cookie(self, cookie: dict) -> None:
+        self.count('add_cookie')
+        self.cookies.append(cookie)
+
+    def delete_all_cookies(self) -> None:
+        self.count('delete_all_cookies')
+        self.cookies = []
+
+    def save_screenshot(self, filename) -> bool:
+        return True
+
+    def set_window_size(self, width, height) -> None:
+        pass
+
+    def set_window_position(self, x, y) -> None:
+        pass
+
+    def quit(self) -> None:
+        pass
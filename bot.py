@@ -0,0 +1,951 @@
+from __future__ import annotations
+
+import json
+import copy
+import logging
+import os
+import random
+import re
+import time
+from datetime import datetime, timedelta
+import itertools
+from pathlib import Path
+from dotenv import load_dotenv
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+from applied_store import AppliedStore
+from browser import BrowserManager
+from form_steps import COVER_LETTER_INPUT, RESUME_INPUT, FormStep, click, fill_fields, read_fields, snapshot
+from job_cards import harvest_job_cards, parse_job_cards
+from job_source import PAGE_SIZE, make_job_source, search_params, search_url
+from metrics import Metrics, timed
+from page import LazyPage
+from paginator import Paginator
+from qa_engine import UNANSWERED, QAEngine
+from qa_store import AnswerStore
+from pipeline import JobPipeline
+from result_sink import ResultSink
+from search_checkpoint import SearchCheckpoint
+from seen_jobs import ALREADY_APPLIED, APPLIED, BLACKLISTED, FAILED, NO_EASY_APPLY, SeenJobs
+from selector_resolver import SelectorResolver
+from session import SessionManager
+from tab_pool import JOB_URL, TabPool
+from title_filter import TitleFilter
+from waiter import JitterPolicy, Waiter
+
+# Load environment variables from .env file
+load_dotenv()
+
+log = logging.getLogger(__name__)
+
+
+class EasyApplyBot:
+    # MAX_SEARCH_TIME is 10 hours by default, feel free to modify it
+    MAX_SEARCH_TIME = 60 * 60
+    # jobs touched within this window are not visited again
+    APPLIED_WINDOW = timedelta(days=2)
+    JOB_TITLE_SELECTORS = [
+        ".jobs-unified-top-card__job-title",
+        ".job-details-jobs-unified-top-card__job-title",
+    ]
+    # generic, tried after the specific selectors and never promoted ahead of them
+    JOB_TITLE_FALLBACKS = [
+        "h1",  # Fallback to any h1
+        ".t-24"  # LinkedIn often uses t-24 class for titles
+    ]
+
+    def __init__(self,
+                 username,
+                 password,
+                 phone_number,
+                 # profile_path,
+                 salary,
+                 rate,
+                 uploads={},
+                 filename='output.csv',
+                 blacklist=[
+                     'Senior',
+                     'Java',
+                     'Oracle',
+                     'Scientist',
+                 ],
+                 blackListTitles=[
+                    r"senior",  # will match any case
+                    r"oracle\b",  # will match "oracle" but not "oracle's"
+                    r"scientist\b",
+                    r"\bpromoted\b",
+                    r"hiring\s*immediately",  # handles variations
+                    r"urgently\s*hiring",
+                    r"0\s*experience\s*required", 
+                 ],
+                 experience_level=[],
+                 results={},
+                 waits={},
+                 profile_dir='linkedin_profile',
+                 applied_store=None,
+                 seen_jobs=None,
+                 sink=None,
+                 rate_limiter=None,
+                 pipeline={},
+                 browser=None,
+                 metrics=None,
+                 qa_rules=None,
+                 browser_config={},
+                 session={},
+                 job_source={},
+                 pagination={},
+                 max_form_steps=10,
+                 tab_pool={},
+                 search_checkpoint=None
+                 ) -> None:
+
+        log.info("Welcome to Easy Apply Bot")
+        dirpath: str = os.getcwd()
+        log.info("current directory is : " + dirpath)
+        log.info("Please wait while we prepare the bot for you")
+        if experience_level:
+            experience_levels = {
+                1: "Entry level",
+                2: "Associate",
+                3: "Mid-Senior level",
+                4: "Director",
+                5: "Executive",
+                6: "Internship"
+            }
+            applied_levels = [experience_levels[level] for level in experience_level]
+            log.info("Applying for experience level roles: " + ", ".join(applied_levels))
+        else:
+            log.info("Applying for all experience levels")
+        
+
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.uploads = uploads
+        self.salary = salary
+        self.rate = rate
+        # Get credentials from environment
+        self.username = os.getenv('LINKEDIN_USERNAME')
+        self.password = os.getenv('LINKEDIN_PASSWORD')
+        self.phone_number = os.getenv('LINKEDIN_PHONE')
+        # self.profile_path = profile_path
+        self.filename: str = filename
+        # stores, sink and rate limiter are shared when running in a WorkerPool
+        # an empty store is falsy (it has __len__), only build one when none is passed
+        self.applied = applied_store if applied_store is not None else \
+            AppliedStore(os.path.splitext(filename)[0] + '.db')
+        self.seen = seen_jobs if seen_jobs is not None else SeenJobs()
+        self.checkpoint = search_checkpoint if search_checkpoint is not None else SearchCheckpoint()
+        self.sink = sink if sink is not None else ResultSink(filename, **results)
+        self.rate_limiter = rate_limiter
+        self.profile_dir = profile_dir
+        self.pipeline = pipeline
+        self.pagination = pagination
+        self.max_form_steps = max_form_steps
+        self.discovery = None
+        # dedup goes through self.applied.has_applied, the CSV only has to be imported
+        self.get_appliedIDs(filename)
+        self.browser_manager = BrowserManager(**browser_config)
+        self.options = self.browser_options(profile_dir)
+
+        try:
+            # a supplied browser is expected to be logged in already
+            self.browser = browser or self.browser_manager.start(self.options,
+                                                                 os.path.join(os.getcwd(), profile_dir))
+            self.metrics.instrument_driver(self.browser)
+            self.wait = WebDriverWait(self.browser, 30)
+            self.waiter = Waiter(self.browser,
+                                 timeout=waits.get('timeout', 10),
+                                 jitter=JitterPolicy(*waits.get('jitter', [0, 0])))
+        except Exception as e:
+            log.error(f"Failed to initialize browser: {e}")
+            raise
+        
+        self.session = SessionManager(session.get('path', f"{profile_dir}_session.json"),
+                                      max_age=session.get('max_age_days', 14) * 86400)
+        if browser is None:
+            self.login(username, password)
+
+        self.blacklist = blacklist
+        self.blackListTitles = blackListTitles
+        self.title_filter = TitleFilter(blacklist, blackListTitles)
+        self.title_resolver = SelectorResolver(self.JOB_TITLE_SELECTORS, self.JOB_TITLE_FALLBACKS)
+        # title of the job being applied to, keyed by jobID
+        self.job_titles: dict = {}
+        self.current_job = None
+        self.phone_number = phone_number
+        self.experience_level = experience_level
+        self.job_source_config = job_source
+        self.job_source = make_job_source(self, job_source)
+        # job pages preloading in background tabs, off unless tab_pool.size is set
+        self.tab_pool = TabPool(self.browser, tab_pool['size'], self.metrics) if tab_pool.get('size') else None
+
+
+        self.locator = {
+            "next": (By.CSS_SELECTOR, "button[aria-label='Continue to next step']"),
+            "review": (By.CSS_SELECTOR, "button[aria-label='Review your application']"),
+            "submit": (By.CSS_SELECTOR, "button[aria-label='Submit application']"),
+            "error": (By.CLASS_NAME, "artdeco-inline-feedback__message"),
+            "upload_resume": (By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-resume')]"),
+            "upload_cv": (By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-cover-letter')]"),
+            "follow": (By.CSS_SELECTOR, "label[for='follow-company-checkbox']"),
+            "upload": (By.NAME, "file"),
+            "search": (By.CLASS_NAME, "jobs-search-results-list"),
+          #  "links": ("xpath", '//div[@data-job-id]'),
+            "links" : (By.CSS_SELECTOR, 'div.job-card-container'),
+            "fields": (By.CLASS_NAME, "jobs-easy-apply-form-section__grouping"),
+            "radio_select": (By.CSS_SELECTOR, "input[type='radio']"), #need to append [value={}].format(answer)
+            "multi_select": (By.XPATH, "//*[contains(@id, 'text-entity-list-form-component')]"),
+            "text_select": (By.CLASS_NAME, "artdeco-text-input--input"),
+            "2fa_oneClick": (By.ID, 'reset-password-submit-button'),
+            "easy_apply_button": (By.XPATH, '//button[contains(@class, "jobs-apply-button")]'),
+            "welcome_back_account": (By.XPATH, "//button[contains(@class, 'active-account')]"),
+            "welcome_back_account": (By.XPATH, "//button[contains(@class, 'active-account')]"),
+            "login_username": (By.ID, "username"),
+            "login_password": (By.ID, "password"),
+            "login_button": (By.XPATH, "//button[@type='submit' and contains(., 'Sign in')]"),
+
+        }
+
+        #initialize questions and answers file, created if it does not exist
+        self.qa_file = Path("qa.csv")
+        self.qa_store = AnswerStore(self.qa_file)
+        self.answers = self.qa_store.load()
+        self.qa_store.compact_if_needed(self.answers)
+        self.qa = QAEngine(self.answers,
+                           rules=QAEngine.rules_from_config(qa_rules),
+                           variables={'salary': salary, 'rate': rate},
+                           persist=self.save_answers)
+        
+        log.info("Login successful, bot is ready")
+
+    def get_appliedIDs(self, filename) -> int:
+        """Bring the AppliedStore up to date with the output CSV, returns the rows imported"""
+        try:
+            # only the rows appended since the last run are parsed, the count is logged by import_csv
+            return self.applied.import_csv(filename)
+        except Exception as e:
+            log.info(str(e) + "   jobIDs could not be loaded from CSV {}".format(filename))
+            return 0
+
+    def browser_options(self, profile_dir='linkedin_profile'):
+        options = webdriver.ChromeOptions()
+        
+        # Set up persistent profile to avoid "new device" emails
+        profile_path = os.path.join(os.getcwd(), profile_dir)
+        if not os.path.exists(profile_path):
+            os.makedirs(profile_path)
+        options.add_argument(f"user-data-dir={profile_path}")
+        
+        # Anti-detection settings
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        
+        # Standard options
+        options.add_argument("--start-maximized")
+        options.add_argument("--ignore-certificate-errors")
+        options.add_argument('--no-sandbox')
+        options.add_argument("--disable-extensions")
+
+        return self.browser_manager.configure(options)
+
+    def verify_login(self, timeout=15) -> bool:
+        """Verify successful login by checking for feed page or profile"""
+        try:
+            WebDriverWait(self.browser, timeout).until(
+                lambda d: any(
+                    url in d.current_url 
+                    for url in ["feed", "in/", "two-step-verification"]
+                )
+            )
+            return True
+        except TimeoutException:
+            log.error(f"Login verification timeout. Current URL: {self.browser.current_url}")
+            self.browser.save_screenshot("login_verification_failed.png")
+            return False
+    
+    def human_delay(self, min_sec=0.5, max_sec=2.0):
+        """Random delay to mimic human behavior"""
+        delay = random.uniform(min_sec, max_sec)
+        time.sleep(delay)
+
+
+    def clear_browser_data(self):
+        """Clear all browser data to prevent session conflicts"""
+        try:
+            self.browser.delete_all_cookies()
+            self.browser.execute_script("window.localStorage.clear();")
+            self.browser.execute_script("window.sessionStorage.clear();")
+            log.info("Browser data cleared successfully")
+        except Exception as e:
+            log.error(f"Failed to clear browser data: {e}")
+
+    def login(self, username, password) -> None:
+        """Reuse the saved session when it is still valid, else log in with credentials"""
+        if self.session.restore(self.browser) and self.session.is_valid(self.browser):
+            log.info("Logged in with saved session")
+            return
+
+        if not self.start_linkedin(username, password):
+            self.browser.save_screenshot("final_login_failure.png")
+            self.browser.quit()
+            raise Exception("Login failed - please check screenshots and try manually")
+        self.session.save(self.browser)
+
+    @timed("login")
+    def start_linkedin(self, username, password, max_attempts=3) -> bool:
+        for attempt in range(1, max_attempts + 1):
+            try:
+                log.info(f"Attempt {attempt}/{max_attempts}: Loading LinkedIn login page")
+                self.browser.get("https://www.linkedin.com/login")
+                
+                # Check for "Welcome Back" account selection
+                try:
+                    account_buttons = WebDriverWait(self.browser, 5).until(
+                        EC.presence_of_all_elements_located((By.XPATH, "//button[contains(@class, 'active-account')]"))
+                    )
+                    if account_buttons:
+                        log.info("Found 'Welcome Back' account selection")
+                        account_buttons[0].click()  # Click the first account
+                        time.sleep(2)
+                except TimeoutException:
+                    pass  # No account selection page found
+                
+                # Wait for login form (with more flexible waiting)
+                try:
+                    login_form = WebDriverWait(self.browser, 10).until(
+                        EC.presence_of_element_located((By.ID, "username"))
+                    )
+                except TimeoutException:
+                    # Maybe already logged in?
+                    if "feed" in self.browser.current_url:
+                        log.info("Already logged in from previous session")
+                        return True
+                    raise
+                
+                # Fill credentials
+                username_field = self.browser.find_element(By.ID, "username")
+                password_field = self.browser.find_element(By.ID, "password")
+                
+                # Clear fields and type slowly
+                username_field.clear()
+                for char in username:
+                    username_field.send_keys(char)
+                    time.sleep(random.uniform(0.05, 0.2))
+                    
+                password_field.clear()
+                for char in password:
+                    password_field.send_keys(char)
+                    time.sleep(random.uniform(0.05, 0.2))
+                
+                # Find and click login button
+                login_button = WebDriverWait(self.browser, 5).until(
+                    EC.element_to_be_clickable((By.XPATH, "//button[@type='submit' and contains(., 'Sign in')]"))
+                )
+                login_button.click()
+                
+                # Check for 2FA
+                try:
+                    WebDriverWait(self.browser, 5).until(
+                        lambda d: "two-step-verification" in d.current_url
+                    )
+                    log.info("2FA required - please complete manually")
+                    time.sleep(20)  # Give time to complete 2FA
+                except TimeoutException:
+                    pass
+                
+                # Verify successful login
+                if self.verify_login():
+                    log.info("Login successful")
+                    return True
+                    
+            except Exception as e:
+                log.error(f"Attempt {attempt} failed: {str(e)}")
+                self.browser.save_screenshot(f"login_error_attempt_{attempt}.png")
+                if attempt < max_attempts:
+                    log.info("Clearing cookies and retrying...")
+                    self.clear_browser_data()
+                    time.sleep(5)
+        
+        log.error(f"Failed to login after {max_attempts} attempts")
+        return False
+
+    def fill_data(self) -> None:
+        if self.browser_manager.lean:
+            # headless has no window to hide, a 1x1 viewport would only break the layout
+            return
+        self.browser.set_window_size(1, 1)
+        self.browser.set_window_position(2000, 2000)
+
+    def start_apply(self, positions, locations, days_old=3, distance=8) -> None:
+        start: float = time.time()
+        self.fill_data()
+        self.positions = positions
+        self.locations = locations
+
+        combos: list = self.checkpoint.plan(positions, locations, lambda: self.get_combos(positions, locations))
+        for position, location in combos:
+            log.info(f"Applying to {position}: {location} (Posted in last {days_old} days, within {distance} km)")
+            self.run_combo(position, location, days_old, distance)
+        self.checkpoint.finish()
+
+        self.sink.flush()
+        self.qa.flush()
+        self.seen.save()
+        log.info(f"Seen jobs by outcome: {self.seen.counts()}")
+        self.waiter.summary()
+        log.info(f"Metrics: {json.dumps(self.metrics.summary())}")
+        if self.discovery is not None:
+            self.discovery.browser.quit()
+            self.discovery = None
+        if self.tab_pool is not None:
+            self.tab_pool.clear()
+        self.job_source.close()
+
+    def run_combo(self, position, location, days_old=3, distance=8) -> None:
+        if self.checkpoint.is_exhausted(position, location):
+            log.info(f"Skipping {position}: {location}, searched through before the restart")
+            return
+        if self.pipeline.get('enabled'):
+            self.pipeline_loop(position, location, days_old, distance)
+        else:
+            self.applications_loop(position, location, days_old, distance)
+
+    @staticmethod
+    def get_combos(positions, locations) -> list:
+        """Every (position, location) pair once, in random order"""
+        combos: list = list(itertools.product(positions, locations))
+        random.shuffle(combos)
+        return combos[:500]
+
+    # self.finish_apply() --> this does seem to cause more harm than good, since it closes the browser which we usually don't want, other conditions will stop the loop and just break out
+
+    def applications_loop(self, position, location, days_old=3, distance=8):
+        progress: dict = self.checkpoint.resume(position, location)
+        if progress['queued']:
+            log.info(f"Resuming {len(progress['queued'])} queued jobs of {position}: {location}")
+            self.apply_page(position, location, progress['queued'])
+        pages: Paginator = self.paginate(position, location, days_old, distance, start=progress['offset'])
+        for start, jobIDs in pages:
+            log.info(f"{len(jobIDs)} new jobs at offset {start}")
+            self.checkpoint.page(position, location, start + pages.page_size, jobIDs)
+            self.apply_page(position, location, jobIDs)
+        self.record_pagination(pages)
+        if pages.finished:
+            self.checkpoint.exhaust(position, location)
+        else:
+            # offset and queue stay as they are, the next run picks the search up again
+            log.warning(f"Search for {position}: {location} did not finish, kept in the checkpoint")
+
+    def apply_page(self, position, location, jobIDs) -> None:
+        try:
+            self.apply_loop(dict.fromkeys(jobIDs, "To be processed"),
+                            processed=lambda jobID: self.checkpoint.processed(position, location, jobID))
+        except Exception as e:
+            log.error(f"Error in applications_loop: {e}")
+
+    def paginate(self, position, location, days_old=3, distance=8, start=0) -> Paginator:
+        """Result pages of one search from offset `start`, each reduced to the jobs not seen before"""
+        return Paginator(lambda start: self.search_jobs(position, location, start, days_old, distance),
+                         self.new_jobs,
+                         count=self.job_source.result_count,
+                         # prefetching would navigate away from the page being applied from
+                         prefetch=0 if self.job_source.uses_browser else self.pagination.get('prefetch', 2),
+                         max_stale=self.pagination.get('max_stale_pages', 3),
+                         # MAX_SEARCH_TIME counts the time used before a restart too
+                         deadline=self.checkpoint.deadline(position, location, self.MAX_SEARCH_TIME),
+                         start=start)
+
+    def new_jobs(self, cards) -> list:
+        """IDs of cards that are not applied to, blacklisted or already in the store"""
+        jobIDs: dict = {}
+        for card in cards:
+            if card.applied or card.job_id == "search" or card.job_id in jobIDs or card.job_id in self.seen:
+                continue
+            if not self.is_blacklisted(card.label) and \
+                    not self.applied.has_applied(card.job_id, within=self.APPLIED_WINDOW):
+                jobIDs[card.job_id] = True
+        return list(jobIDs)
+
+    def record_pagination(self, pages: Paginator) -> None:
+        self.metrics.inc('search:pages', pages.stats['pages'])
+        self.metrics.inc('search:stale_pages', pages.stats['stale'])
+        self.metrics.inc('search:unused_prefetch', pages.stats['unused'])
+        self.metrics.inc('search:failed_pages', pages.stats['failed'])
+        log.info(f"Searched {pages.stats['pages']} pages"
+                 f"{f' of {pages.total} results' if pages.total is not None else ''}, "
+                 f"{pages.stats['stale']} without new jobs")
+
+    def pipeline_loop(self, position, location, days_old=3, distance=8) -> None:
+        """Discover jobs in a second browser while this one applies"""
+        if not self.job_source.uses_browser:
+            # results come over HTTP, no second browser needed
+            discovery = self
+        else:
+            if self.discovery is None:
+                self.discovery = self.spawn_discovery()
+            discovery = self.discovery
+
+        pipeline = JobPipeline(lambda: discovery.discover_jobs(position, location, days_old, distance),
+                               lambda jobID: self.process_job(jobID, upcoming=pipeline.upcoming()),
+                               maxsize=self.pipeline.get('queue_size', 25),
+                               checkpoint=self.pipeline.get('checkpoint', 'pipeline_checkpoint.json'))
+        processed: int = pipeline.run()
+        log.info(f"Pipeline finished {position}: {location} after {processed} jobs")
+        if pipeline.error is None:
+            self.checkpoint.exhaust(position, location)
+
+    def spawn_discovery(self) -> EasyApplyBot:
+        """Copy of this bot driving its own browser, logged in with our cookies"""
+        discovery = copy.copy(self)
+        if self.browser_manager.backend == 'cdp':
+            # a second tab of the same browser already shares our cookies
+            discovery.browser = self.browser_manager.new_tab(self.options, os.path.join(os.getcwd(), self.profile_dir))
+        else:
+            discovery.browser = webdriver.Chrome(service=self.browser_manager.service(),
+                                                 options=self.browser_options(self.profile_dir + '_discovery'))
+            self.browser_manager.prepare(discovery.browser)
+        self.metrics.instrument_driver(discovery.browser)
+        discovery.wait = WebDriverWait(discovery.browser, 30)
+        discovery.waiter = Waiter(discovery.browser, timeout=self.waiter.timeout, jitter=self.waiter.jitter)
+        discovery.job_source = make_job_source(discovery, self.job_source_config)
+        discovery.tab_pool = None
+        if self.browser_manager.backend != 'cdp':
+            discovery.browser.get("https://www.linkedin.com")
+            for cookie in self.browser.get_cookies():
+                try:
+                    discovery.browser.add_cookie(cookie)
+                except Exception as e:
+                    log.debug(f"Could not copy cookie {cookie.get('name')}: {e}")
+        discovery.fill_data()
+        return discovery
+
+    def discover_jobs(self, position, location, days_old=3, distance=8):
+        """Yield new, non-blacklisted job IDs page by page"""
+        progress: dict = self.checkpoint.resume(position, location)
+        pages: Paginator = self.paginate(position, location, days_old, distance, start=progress['offset'])
+        for start, jobIDs in pages:
+            log.info(f"Discovered {len(jobIDs)} new jobs for {position}: {location} (offset {start})")
+            yield from jobIDs
+            # the pipeline checkpoints the queued jobs themselves
+            self.checkpoint.page(position, location, start + pages.page_size, [])
+        self.record_pagination(pages)
+        if not pages.finished:
+            # reported as a discovery error, which keeps the combo in the checkpoint
+            raise pages.error or RuntimeError(f"Search for {position}: {location} stopped early")
+
+    @timed("search")
+    def search_jobs(self, position, location, start=0, days_old=3, distance=8) -> list:
+        """One page of search results from the configured JobSource"""
+        return self.job_source.search(position, location, start, days_old, distance)
+
+    @timed("job_cards")
+    def get_job_cards(self) -> list:
+        """All job cards on the current results page as JobCard records"""
+        try:
+            return harvest_job_cards(self.browser, self.locator["links"][1])
+        except Exception as e:
+            log.debug(f"Script harvest failed, parsing page source instead: {e}")
+            return parse_job_cards(self.browser.page_source, self.locator["links"][1])
+
+    @timed("job_title")
+    def get_job_title(self) -> str:
+        """Job title of the open job page, looked up once per job"""
+        if self.current_job in self.job_titles:
+            return self.job_titles[self.current_job]
+        try:
+            # all candidate selectors are tried in one script call
+            title = self.waiter.until("job_title", self.title_resolver.probe, timeout=5)
+            if not title:
+                # Final fallback to browser title
+                title = self.browser.title.split('|')[0].strip()
+        except Exception as e:
+            log.error(f"Failed to extract job title: {str(e)}")
+            return "Unknown Position"
+
+        if self.current_job is not None:
+            self.job_titles = {self.current_job: title}
+        return title
+
+    def is_blacklisted(self, title: str) -> bool:
+        """More comprehensive blacklist checking"""
+        if not title or title == "Unknown Position":
+            return False
+
+        return self.title_filter.match(title) is not None
+
+    def apply_loop(self, jobIDs, processed=None):
+        queue: list = [jobID for jobID, state in jobIDs.items() if state == "To be processed"]
+        for i, jobID in enumerate(queue):
+            jobIDs[jobID] = self.process_job(jobID, upcoming=queue[i + 1:])
+            if processed is not None:
+                processed(jobID)
+
+    def process_job(self, jobID, upcoming=()) -> bool:
+        """Apply to jobID, with the jobs queued after it preloading meanwhile when the tab pool is on"""
+        if self.tab_pool is not None:
+            self.tab_pool.preload([nextID for nextID in upcoming if nextID not in self.seen], current=jobID)
+        # opened already by an overlapping search, no need to load the page again
+        if jobID in self.seen:
+            self.metrics.inc('jobs:seen_skipped')
+            self.discard_tab(jobID)
+            return False
+        # another worker may have picked this job up from an overlapping search
+        if not self.applied.claim(jobID, within=self.APPLIED_WINDOW):
+            self.discard_tab(jobID)
+            return False
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        try:
+            applied = self.apply_to_job(jobID)
+        except Exception:
+            self.seen.record(jobID, FAILED)
+            raise
+        if applied:
+            log.info(f"Applied to {jobID}")
+        else:
+            log.info(f"Failed to apply to {jobID}")
+        self.metrics.inc('jobs:applied' if applied else 'jobs:not_applied')
+        return applied
+
+    @timed("job")
+    def apply_to_job(self, jobID):
+        # #self.avoid_lock() # annoying
+
+        # get job page
+        self.current_job = jobID
+        self.get_job_page(jobID)
+
+        # Check title against blacklist BEFORE proceeding
+        title = self.get_job_title()
+        if self.is_blacklisted(title):
+            log.info(f'Skipping blacklisted job: {title}')
+            self.write_to_file(False, jobID, title, False)
+            self.seen.record(jobID, BLACKLISTED)
+            return False
+
+        # get easy apply button
+        button = self.get_easy_apply_button()
+
+
+        # word filter to skip positions not wanted
+        if button is not False:
+            print("title: {}".format(self.browser.title))
+          
+            if self.is_blacklisted(self.browser.title):
+                log.info('skipping this application, a blacklisted keyword was found in the job position')
+                string_easy = "* Contains blacklisted keyword"
+                outcome = BLACKLISTED
+                result = False
+            else:
+                string_easy = "* has Easy Apply Button"
+                log.info("Clicking the EASY apply button")
+                self.waiter.clickable("easy_apply_button", button)
+                button.click()
+                clicked = True
+                self.waiter.quiet("easy_apply_modal")
+                self.fill_out_fields()
+                result: bool = self.send_resume()
+                if result:
+                    string_easy = "*Applied: Sent Resume"
+                    outcome = APPLIED
+                else:
+                    string_easy = "*Did not apply: Failed to send Resume"
+                    outcome = FAILED
+        elif "You applied on" in self.browser.page_source:
+            log.info("You have already applied to this position.")
+            string_easy = "* Already Applied"
+            outcome = ALREADY_APPLIED
+            result = False
+        else:
+            log.info("The Easy apply button does not exist.")
+            string_easy = "* Doesn't have Easy Apply Button"
+            outcome = NO_EASY_APPLY
+            result = False
+
+
+        # position_number: str = str(count_job + jobs_per_page)
+        log.info(f"\nPosition {jobID}:\n {self.browser.title} \n {string_easy} \n")
+
+        self.write_to_file(button, jobID, self.browser.title, result)
+        self.seen.record(jobID, outcome)
+        return result
+
+    def write_to_file(self, button, jobID, browserTitle, result) -> None:
+        def re_extract(text, pattern):
+            target = re.search(pattern, text)
+            if target:
+                target = target.group(1)
+            return target
+
+        timestamp: str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        attempted: bool = False if button == False else True
+        job = re_extract(browserTitle.split(' | ')[0], r"\(?\d?\)?\s?(\w.*)")
+        company = re_extract(browserTitle.split(' | ')[1], r"(\w.*)")
+
+        toWrite: list = [timestamp, jobID, job, company, attempted, result]
+        self.sink.write(toWrite)
+        self.applied.record(jobID, job, company, attempted, result, timestamp=timestamp)
+
+    def discard_tab(self, jobID) -> None:
+        if self.tab_pool is not None:
+            self.tab_pool.discard(jobID)
+
+    @timed("job_page")
+    def get_job_page(self, jobID):
+
+        if self.tab_pool is not None and self.tab_pool.take(jobID):
+            # loaded in the background, the checks below usually pass at once
+            self.browser_manager.prepare(self.browser)
+        else:
+            self.browser.get(JOB_URL.format(jobID))
+        
+        # Verify page loaded properly
+        try:
+            self.wait.until(
+                lambda driver: driver.execute_script("return document.readyState") == "complete"
+            )
+            self.wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-unified-top-card"))
+            )
+        except TimeoutException:
+            log.error("Job page failed to load properly")
+            return False
+            
+        return self.load_page(timeout=4)
+
+    @timed("easy_apply_button")
+    def get_easy_apply_button(self):
+        EasyApplyButton = False
+        try:
+            buttons = self.get_elements("easy_apply_button")
+            # buttons = self.browser.find_elements("xpath",
+            #     '//button[contains(@class, "jobs-apply-button")]'
+            # )
+            for button in buttons:
+                if "Easy Apply" in button.text:
+                    EasyApplyButton = button
+                    self.wait.until(EC.element_to_be_clickable(EasyApplyButton))
+                else:
+                    log.debug("Easy Apply button not found")
+            
+        except Exception as e: 
+            print("Exception:",e)
+            log.debug("Easy Apply button not found")
+
+
+        return EasyApplyButton
+
+    @timed("fill_out_fields")
+    def fill_out_fields(self):
+        self.fill_form(lambda field: self.phone_number if "Mobile phone number" in field.label else None)
+
+    def fill_form(self, answer) -> list:
+        """Fill the fields of the current step that `answer(field)` returns a value for.
+
+        Fields are read in one script call and filled in another. Returns the fields left unfilled.
+        """
+        fields: list = read_fields(self.browser)
+        values: dict = {}
+        for field in fields:
+            value = answer(field)
+            if value is not None:
+                values[field.index] = value
+        missed: list = fill_fields(self.browser, values)
+        if missed:
+            log.info(f"Could not fill {len(missed)} fields: {[fields[i].label for i in missed]}")
+        return [field for field in fields if field.index not in values or field.index in missed]
+
+    def get_elements(self, type) -> list:
+        elements = []
+        element = self.locator[type]
+        if self.is_present(element):
+            elements = self.browser.find_elements(element[0], element[1])
+        return elements
+
+    def is_present(self, locator):
+        return len(self.browser.find_elements(locator[0],
+                                              locator[1])) > 0
+
+    @timed("send_resume")
+    def send_resume(self) -> bool:
+        # Check if resume is configured
+        if "resumes" not in self.uploads or not self.uploads["resumes"]:
+            log.error("No resumes configured in uploads")
+            return False
+        
+        # Default to first resume
+        selected_resume = self.uploads["resumes"][-1]["path"]
+
+        #def is_present(button_locator) -> bool:
+        #    return len(self.browser.find_elements(*button_locator)) > 0
+
+        try:
+            # Get job title for resume selection
+            job_title = self.get_job_title().lower()
+            
+            for resume in self.uploads["resumes"]:
+                if any(keyword.lower() in job_title for keyword in resume["keywords"]):
+                    selected_resume = resume["path"]
+                    log.info(f"Selected resume: {resume['name']}")
+                    break
+        
+        except Exception as e:
+            log.warning(f"Could not select resume by keywords: {e}") 
+
+        # Verify resume exists
+        if not os.path.exists(selected_resume):
+            log.error(f"Resume file not found: {selected_resume}")
+            return False 
+
+           
+
+        submitted = False
+        error_rounds = 0
+        for step in range(self.max_form_steps):
+            self.waiter.quiet("send_resume_step")
+            form: FormStep = snapshot(self.browser)
+
+            if form.sent:
+                log.info("Application Submitted")
+                return True
+            if not form.open:
+                log.info("Easy Apply form is not open, application not submitted")
+                return submitted
+
+            if form.upload_resume:
+                try:
+                    self.browser.find_element(By.CSS_SELECTOR, RESUME_INPUT).send_keys(os.path.abspath(selected_resume))
+                    self.waiter.network_idle("resume_upload")  # Wait for upload to complete
+                except Exception as e:
+                    log.error(f"Resume upload failed: {e}")
+                    log.debug(f"Resume: {selected_resume}")
+
+            if form.upload_cover_letter and "Cover Letter" in self.uploads:
+                try:
+                    self.browser.find_element(By.CSS_SELECTOR, COVER_LETTER_INPUT).send_keys(
+                        self.uploads["Cover Letter"])
+                except Exception as e:
+                    log.error(f"Cover letter upload failed: {e}")
+
+            if form.errors:
+                if error_rounds >= 2:
+                    log.info(f"Skipping application, form still shows errors: {form.errors}")
+                    return False
+                error_rounds += 1
+                log.info("Please answer the questions, waiting for the form to settle...")
+                self.process_questions()
+                # look at the same step again once the answers are in
+                continue
+            error_rounds = 0
+            if form.empty_fields:
+                self.process_questions()
+
+            if form.has("submit"):
+                if form.has("follow"):
+                    click(self.browser, "follow")
+                click(self.browser, "submit")
+                log.info("Application Submitted")
+                submitted = True
+                break
+            elif form.has("next"):
+                click(self.browser, "next")
+            elif form.has("review"):
+                click(self.browser, "review")
+            else:
+                log.info("Application not submitted")
+                break
+        else:
+            log.info(f"Application not submitted, gave up after {self.max_form_steps} form steps")
+
+        return submitted
+
+    @timed("questions")
+    def process_questions(self):
+        def answer(field):
+            if field.value:
+                return None
+            if "Mobile phone number" in field.label:
+                return self.phone_number
+            return self.ans_question(field.label.lower(), wait=False)
+
+        unanswered: list = [field for field in self.fill_form(answer) if not field.value]
+        if unanswered:
+            # one pause for all of them, done once the user stops editing the form
+            self.waiter.quiet("ans_question", quiet=3, timeout=15)
+
+    def ans_question(self, question, wait=True):
+        """Answer for question, None if it has to be answered by hand"""
+        answer = self.qa.lookup(question)
+        if answer is None:
+            log.info("Not able to answer question automatically. Please provide answer")
+            if wait:
+                # give the user a chance to type, done once they stop editing the form
+                self.waiter.quiet("ans_question", quiet=3, timeout=15)
+        else:
+            log.info("Answering question: " + question + " with answer: " + answer)
+
+        # Remember the question and answer, written to the CSV in batches;
+        # unanswered questions are documented with a placeholder
+        if not self.qa.known(question):
+            stored: str = UNANSWERED if answer is None else answer
+            self.answers[question] = stored
+            self.qa.add(question, stored)
+            log.info(f"Queued for QA file: '{question}' with answer: '{stored}'.")
+
+        return answer
+
+    def save_answers(self, rows) -> None:
+        self.qa_store.append(rows)
+        log.info(f"Appended {len(rows)} answers to QA file")
+
+    @timed("load_page")
+    def load_page(self, items=None, timeout=8) -> LazyPage:
+        """Scroll the list of `items` until no more load, or just let the page settle without items.
+
+        The page is only parsed if the caller reads the returned LazyPage.
+        """
+        if items:
+            # results render client-side after the load event, scrolling an empty list would end at once
+            self.waiter.present("load_page_first_item", (By.CSS_SELECTOR, items), timeout=min(timeout, 5))
+            loaded: int = self.waiter.scroll("load_page", items, timeout=timeout)
+            log.debug(f"{loaded} results loaded")
+        else:
+            self.waiter.quiet("load_page", quiet=0.3, timeout=timeout)
+        return LazyPage(self.browser)
+
+    def avoid_lock(self) -> None:
+        # pyautogui needs a display, so it is only imported when actually used
+        import pyautogui
+
+        x, _ = pyautogui.position()
+        pyautogui.moveTo(x + 200, pyautogui.position().y, duration=1.0)
+        pyautogui.moveTo(x, pyautogui.position().y, duration=0.5)
+        pyautogui.keyDown('ctrl')
+        pyautogui.press('esc')
+        pyautogui.keyUp('ctrl')
+        time.sleep(0.5)
+        pyautogui.press('esc')
+
+    @timed("search_page")
+    def next_jobs_page(self, position, location, jobs_per_page, experience_level=[], days_old=3, distance=8):
+        """Constructs the URL with proper filters for job search"""
+        try:
+            url: str = search_url(search_params(position, location, jobs_per_page,
+                                                experience_level, days_old, distance))
+            log.info(f"Loading jobs page with URL: {url}")
+            
+            self.browser.get(url)
+            self.load_page(self.locator["links"][1])
+            
+            return (self.browser, jobs_per_page + PAGE_SIZE)
+        except Exception as e:
+            log.error(f"Error in next_jobs_page: {e}")
+            return (self.browser, jobs_per_page)
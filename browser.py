@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import shutil
+import socket
+import subprocess
+import threading
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+from atomic_file import write_json_atomic
+
+log = logging.getLogger(__name__)
+
+CHROME_BINARIES = ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome']
+
+# lean mode: headless, no background services and a capped V8 heap per renderer
+LEAN_ARGUMENTS = [
+    "--headless=new",
+    "--window-size=1280,1024",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication",
+    "--mute-audio",
+    "--no-first-run",
+    "--blink-settings=imagesEnabled=false",
+]
+LEAN_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+    "profile.managed_default_content_settings.notifications": 2,
+    "profile.managed_default_content_settings.geolocation": 2,
+}
+# requests dropped in lean mode through Network.setBlockedURLs
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    "*doubleclick.net*", "*google-analytics.com*", "*googletagmanager.com*",
+    "*px.ads.linkedin.com*", "*li.protechts.net*", "*facebook.net*", "*bat.bing.com*",
+]
+
+
+def major_version(command: list) -> str | None:
+    """Major version printed by `<binary> --version`, None if it cannot be run"""
+    try:
+        output: str = subprocess.run(command + ['--version'], capture_output=True, text=True, timeout=5).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    found = re.search(r'(\d+)\.\d+\.\d+', output)
+    return found.group(1) if found else None
+
+
+def port_open(port: int, host: str = '127.0.0.1') -> bool:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.5)
+        return sock.connect_ex((host, port)) == 0
+
+
+class BrowserManager:
+    """Resolves chromedriver once and starts or re-attaches to Chrome.
+
+    The driver path is cached in `cache_file` together with the Chrome major
+    version it was resolved for. While Chrome stays on that version the
+    cached binary is used without touching the network. With
+    `debugger_port` set, Chrome is launched detached with remote debugging
+    on that port and later runs attach to it, so a restarted bot reuses the
+    running, already logged-in browser instead of cold-starting a new one.
+
+    With `lean` set, Chrome runs headless with images, fonts, media and
+    trackers blocked and each renderer's JS heap capped at
+    `renderer_memory_mb`, so more bots fit on one machine.
+
+    With `backend` 'cdp' chromedriver is not used at all: Chrome is driven
+    over the DevTools protocol from one asyncio loop, and every bot in the
+    process gets its own tab in the same browser (see cdp.py).
+    """
+
+    # one CDPHost per debugging port, shared by all bots in the process
+    hosts: dict = {}
+    hosts_lock = threading.Lock()
+
+    def __init__(self, cache_file: str = '.driver_cache.json', debugger_port: int | None = None,
+                 chrome_binary: str | None = None, lean: bool = False, renderer_memory_mb: int = 512,
+                 backend: str = 'selenium') -> None:
+        self.cache_file = cache_file
+        self.debugger_port = debugger_port or (9222 if backend == 'cdp' else None)
+        self.backend = backend
+        self.lean = lean
+        self.renderer_memory_mb = renderer_memory_mb
+        self.chrome_binary = chrome_binary or next(filter(None, map(shutil.which, CHROME_BINARIES)), None)
+        self._driver_path: str | None = None
+
+    def driver_path(self) -> str:
+        if self._driver_path:
+            return self._driver_path
+
+        cache: dict = self._read_cache()
+        chrome_version: str | None = major_version([self.chrome_binary]) if self.chrome_binary else None
+        cached: str | None = cache.get('path')
+        if cached and os.path.isfile(cached) and \
+                (chrome_version is None or cache.get('chrome_version') == chrome_version):
+            log.debug(f"Using cached chromedriver {cached}")
+            self._driver_path = cached
+            return cached
+
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+            path: str = ChromeDriverManager().install()
+        except Exception as e:
+            if cached and os.path.isfile(cached):
+                log.warning(f"Could not resolve chromedriver ({e}), falling back to cached {cached}")
+                self._driver_path = cached
+                return cached
+            raise
+
+        self._write_cache({'path': path, 'chrome_version': chrome_version,
+                           'driver_version': major_version([path]), 'resolved': time.time()})
+        self._driver_path = path
+        return path
+
+    def service(self) -> ChromeService:
+        return ChromeService(self.driver_path())
+
+    def configure(self, options):
+        """Add the lean mode switches to `options`, unchanged otherwise"""
+        if not self.lean:
+            return options
+        for argument in LEAN_ARGUMENTS:
+            options.add_argument(argument)
+        options.add_argument(f"--js-flags=--max-old-space-size={self.renderer_memory_mb}")
+        options.add_argument("--renderer-process-limit=2")
+        options.add_experimental_option("prefs", LEAN_PREFS)
+        return options
+
+    def prepare(self, browser) -> None:
+        """Block heavy and tracking requests in a freshly started lean browser"""
+        if not self.lean:
+            return
+        try:
+            browser.execute_cdp_cmd("Network.enable", {})
+            browser.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+        except Exception as e:
+            log.warning(f"Could not block requests, continuing without: {e}")
+
+    def start(self, options, profile_path: str) -> webdriver.Chrome:
+        """New Chrome session, attached to a detached browser when debugger_port is set"""
+        if self.backend == 'cdp':
+            return self.new_tab(options, profile_path)
+        if not self.debugger_port:
+            browser = webdriver.Chrome(service=self.service(), options=options)
+        else:
+            if port_open(self.debugger_port):
+                log.info(f"Attaching to running Chrome on port {self.debugger_port}")
+            else:
+                self.launch(options, profile_path)
+            attach = webdriver.ChromeOptions()
+            attach.add_experimental_option("debuggerAddress", f"127.0.0.1:{self.debugger_port}")
+            browser = webdriver.Chrome(service=self.service(), options=attach)
+        self.prepare(browser)
+        return browser
+
+    def new_tab(self, options, profile_path: str):
+        """CDPDriver on a new tab of the shared browser, launched on first use"""
+        from cdp import CDPHost
+
+        with self.hosts_lock:
+            host = self.hosts.get(self.debugger_port)
+            if host is None:
+                if port_open(self.debugger_port):
+                    log.info(f"Attaching to running Chrome on port {self.debugger_port}")
+                else:
+                    self.launch(options, profile_path)
+                host = self.hosts[self.debugger_port] = CDPHost(self.debugger_port)
+        browser = host.new_driver()
+        self.prepare(browser)
+        return browser
+
+    def launch(self, options, profile_path: str, timeout: float = 20) -> None:
+        """Start Chrome outside of chromedriver so it outlives the bot process"""
+        if not self.chrome_binary:
+            raise RuntimeError("Chrome binary not found, set browser.chrome_binary in config.yaml")
+        arguments: list = [a for a in options.arguments if not a.startswith('user-data-dir')]
+        command: list = [self.chrome_binary, f"--remote-debugging-port={self.debugger_port}",
+                         f"--user-data-dir={profile_path}", *arguments]
+        log.info(f"Launching Chrome with remote debugging on port {self.debugger_port}")
+        subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+
+        deadline: float = time.time() + timeout
+        while not port_open(self.debugger_port):
+            if time.time() > deadline:
+                raise RuntimeError(f"Chrome did not open port {self.debugger_port} within {timeout} s")
+            time.sleep(0.2)
+
+    def _read_cache(self) -> dict:
+        try:
+            with open(self.cache_file, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_cache(self, data: dict) -> None:
+        # workers resolving the driver at the same time each write their own temp file
+        write_json_atomic(self.cache_file, data)
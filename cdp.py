@@ -0,0 +1,488 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import itertools
+import json
+import logging
+import threading
+import urllib.request
+
+from selenium.common.exceptions import JavascriptException, NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+log = logging.getLogger(__name__)
+
+# Finds elements by CSS or XPath below `this` (the element, or the document
+# when the call is made on the global object).
+FIND_SCRIPT = """
+function(by, value) {
+    const root = this instanceof Node ? this : document;
+    if (by === 'xpath') {
+        const found = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        return Array.from({length: found.snapshotLength}, (_, i) => found.snapshotItem(i));
+    }
+    return Array.from(root.querySelectorAll(value));
+}
+"""
+
+# Selenium reads a property first and falls back to the attribute.
+ATTRIBUTE_SCRIPT = """
+function(name) {
+    const value = this[name];
+    if (value !== undefined && value !== null && typeof value !== 'object' && typeof value !== 'function') {
+        return value === true ? 'true' : value === false ? null : String(value);
+    }
+    return this.getAttribute(name);
+}
+"""
+
+
+class CDPError(Exception):
+    pass
+
+
+def to_selector(by: str, value: str) -> tuple:
+    """Selenium locator as ('css' | 'xpath', selector)"""
+    if by == By.XPATH:
+        return 'xpath', value
+    if by == By.CSS_SELECTOR:
+        return 'css', value
+    if by == By.CLASS_NAME:
+        return 'css', '.' + '.'.join(value.split())
+    if by == By.ID:
+        return 'css', f'[id="{value}"]'
+    if by == By.NAME:
+        return 'css', f'[name="{value}"]'
+    if by == By.TAG_NAME:
+        return 'css', value
+    raise ValueError(f"Unsupported locator strategy {by}")
+
+
+class CDPConnection:
+    """One websocket to the browser, shared by the sessions of every tab.
+
+    Commands are matched to their replies by id and events are handed to
+    whoever registered for them with `wait_for`, so any number of tabs can
+    have commands in flight on the same connection at once.
+    """
+
+    def __init__(self, websocket) -> None:
+        self.websocket = websocket
+        self.ids = itertools.count(1)
+        self.pending: dict = {}
+        self.listeners: list = []
+        self.reader: asyncio.Task | None = None
+
+    @classmethod
+    async def connect(cls, url: str) -> CDPConnection:
+        # optional dependency, only needed for the cdp backend
+        import websockets
+
+        connection = cls(await websockets.connect(url, max_size=None, ping_interval=None))
+        connection.reader = asyncio.create_task(connection._read())
+        return connection
+
+    async def send(self, method: str, params: dict | None = None, session_id: str | None = None) -> dict:
+        message: dict = {"id": next(self.ids), "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        reply = asyncio.get_running_loop().create_future()
+        self.pending[message["id"]] = reply
+        await self.websocket.send(json.dumps(message))
+        return await reply
+
+    def wait_for(self, method: str, session_id: str | None = None, predicate=None) -> asyncio.Future:
+        """Future resolved with the params of the next matching event"""
+        event = asyncio.get_running_loop().create_future()
+        self.listeners.append((method, session_id, predicate, event))
+        return event
+
+    async def close(self) -> None:
+        await self.websocket.close()
+        if self.reader is not None:
+            await asyncio.gather(self.reader, return_exceptions=True)
+
+    async def _read(self) -> None:
+        try:
+            async for raw in self.websocket:
+                message: dict = json.loads(raw)
+                if "id" in message:
+                    reply = self.pending.pop(message["id"], None)
+                    if reply is None or reply.done():
+                        continue
+                    if "error" in message:
+                        reply.set_exception(CDPError(message["error"].get("message", str(message["error"]))))
+                    else:
+                        reply.set_result(message.get("result", {}))
+                    continue
+                self._dispatch(message)
+        finally:
+            for reply in self.pending.values():
+                if not reply.done():
+                    reply.set_exception(ConnectionError("DevTools connection closed"))
+            self.pending.clear()
+
+    def _dispatch(self, message: dict) -> None:
+        params: dict = message.get("params", {})
+        for listener in list(self.listeners):
+            method, session_id, predicate, event = listener
+            if event.done():
+                self.listeners.remove(listener)
+                continue
+            if method != message.get("method") or (session_id and session_id != message.get("sessionId")):
+                continue
+            if predicate is None or predicate(params):
+                event.set_result(params)
+                self.listeners.remove(listener)
+
+
+class CDPTab:
+    """Async operations the bot needs, on one page target"""
+
+    def __init__(self, connection: CDPConnection, target_id: str, session_id: str) -> None:
+        self.connection = connection
+        self.target_id = target_id
+        self.session_id = session_id
+
+    @classmethod
+    async def open(cls, connection: CDPConnection, url: str = "about:blank") -> CDPTab:
+        target: dict = await connection.send("Target.createTarget", {"url": url})
+        return await cls.attach(connection, target["targetId"])
+
+    @classmethod
+    async def attach(cls, connection: CDPConnection, target_id: str) -> CDPTab:
+        attached: dict = await connection.send("Target.attachToTarget", {"targetId": target_id, "flatten": True})
+        tab = cls(connection, target_id, attached["sessionId"])
+        await tab.send("Page.enable")
+        return tab
+
+    async def send(self, method: str, params: dict | None = None) -> dict:
+        return await self.connection.send(method, params, self.session_id)
+
+    async def wait_for(self, method: str, predicate=None, timeout: float = 30) -> dict:
+        event = self.connection.wait_for(method, self.session_id, predicate)
+        try:
+            return await asyncio.wait_for(event, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutException(f"{method} did not arrive within {timeout} s")
+
+    async def navigate(self, url: str, timeout: float = 30) -> None:
+        loaded = self.connection.wait_for("Page.loadEventFired", self.session_id)
+        result: dict = await self.send("Page.navigate", {"url": url})
+        if result.get("errorText"):
+            loaded.cancel()
+            raise CDPError(f"Navigation to {url} failed: {result['errorText']}")
+        try:
+            await asyncio.wait_for(loaded, timeout)
+        except asyncio.TimeoutError:
+            log.debug(f"Load event for {url} did not fire within {timeout} s")
+
+    async def reload(self, timeout: float = 30) -> None:
+        loaded = self.connection.wait_for("Page.loadEventFired", self.session_id)
+        await self.send("Page.reload")
+        try:
+            await asyncio.wait_for(loaded, timeout)
+        except asyncio.TimeoutError:
+            log.debug(f"Reload did not finish within {timeout} s")
+
+    async def evaluate(self, expression: str, await_promise: bool = False):
+        result: dict = await self.send("Runtime.evaluate", {"expression": expression, "returnByValue": True,
+                                                            "awaitPromise": await_promise, "userGesture": True})
+        return self._value(result)
+
+    async def call(self, declaration: str, *args, on: str | None = None, by_value: bool = True):
+        """Call a JS function with `this` bound to object `on`, or to the global object"""
+        params: dict = {"functionDeclaration": declaration,
+                        "arguments": [{"objectId": arg.object_id} if isinstance(arg, CDPElement) else {"value": arg}
+                                      for arg in args],
+                        "returnByValue": by_value, "awaitPromise": True, "userGesture": True}
+        if on is None:
+            on = (await self.send("Runtime.evaluate", {"expression": "globalThis"}))["result"]["objectId"]
+        params["objectId"] = on
+        result: dict = await self.send("Runtime.callFunctionOn", params)
+        return self._value(result) if by_value else result["result"]
+
+    async def run_script(self, script: str, *args):
+        """execute_script: `script` reads `arguments` and may `return` a value"""
+        return await self.call(f"function() {{ {script} }}", *args)
+
+    async def run_async_script(self, script: str, *args, timeout: float = 30):
+        """execute_async_script: the last argument is the callback that resolves it"""
+        declaration: str = (f"function() {{ const args = Array.from(arguments); "
+                            f"return new Promise(done => (function() {{ {script} }}).apply(this, args.concat([done]))); }}")
+        return await asyncio.wait_for(self.call(declaration, *args), timeout)
+
+    async def find(self, by: str, value: str, within: str | None = None) -> list:
+        """Object ids of the elements matching a Selenium locator"""
+        kind, selector = to_selector(by, value)
+        array: dict = await self.call(FIND_SCRIPT, kind, selector, on=within, by_value=False)
+        properties: dict = await self.send("Runtime.getProperties", {"objectId": array["objectId"],
+                                                                     "ownProperties": True})
+        items: list = [p for p in properties["result"] if p["name"].isdigit() and "objectId" in p.get("value", {})]
+        return [p["value"]["objectId"] for p in sorted(items, key=lambda p: int(p["name"]))]
+
+    async def insert_text(self, object_id: str, text: str) -> None:
+        await self.call("function() { this.focus(); }", on=object_id)
+        await self.send("Input.insertText", {"text": text})
+
+    async def set_files(self, object_id: str, paths: list) -> None:
+        await self.send("DOM.setFileInputFiles", {"objectId": object_id, "files": paths})
+
+    async def screenshot(self, path: str) -> None:
+        result: dict = await self.send("Page.captureScreenshot", {"format": "png"})
+        with open(path, "wb") as f:
+            f.write(base64.b64decode(result["data"]))
+
+    async def close(self) -> None:
+        await self.connection.send("Target.closeTarget", {"targetId": self.target_id})
+
+    @staticmethod
+    def _value(result: dict):
+        if "exceptionDetails" in result:
+            details: dict = result["exceptionDetails"]
+            raise JavascriptException(details.get("exception", {}).get("description") or details.get("text"))
+        return result.get("result", {}).get("value")
+
+
+class CDPHost:
+    """One browser and one event loop thread driving all of its tabs.
+
+    The loop runs on a daemon thread; every CDPDriver hands its coroutines
+    to it, so many bots in one process share a single Chrome and a single
+    websocket, each in its own tab.
+    """
+
+    def __init__(self, port: int) -> None:
+        self.port = port
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="cdp", daemon=True)
+        self.thread.start()
+        self.connection: CDPConnection = self.run(self._connect())
+        self.lock = threading.Lock()
+        self.tabs = 0
+
+    def run(self, coroutine, timeout: float | None = None):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def new_driver(self) -> CDPDriver:
+        tab: CDPTab = self.run(CDPTab.open(self.connection))
+        with self.lock:
+            self.tabs += 1
+        return CDPDriver(self, tab)
+
+    def release(self, driver: CDPDriver) -> None:
+        self.run(driver.tab.close())
+        with self.lock:
+            self.tabs -= 1
+
+    def close(self) -> None:
+        try:
+            self.run(self.connection.send("Browser.close"), timeout=5)
+        except Exception as e:
+            log.debug(f"Browser.close failed: {e}")
+        self.run(self.connection.close(), timeout=5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+    async def _connect(self) -> CDPConnection:
+        url: str = f"http://127.0.0.1:{self.port}/json/version"
+        version: bytes = await asyncio.get_running_loop().run_in_executor(
+            None, lambda: urllib.request.urlopen(url, timeout=5).read())
+        return await CDPConnection.connect(json.loads(version)["webSocketDebuggerUrl"])
+
+
+class CDPElement(WebElement):
+    """WebElement backed by a DevTools remote object id"""
+
+    def __init__(self, driver: CDPDriver, object_id: str) -> None:
+        self._driver = driver
+        self.object_id = object_id
+        self._id = object_id
+
+    def _call(self, declaration: str, *args):
+        return self._driver._execute('elementCall', self._driver.tab.call(declaration, *args, on=self.object_id))
+
+    @property
+    def text(self) -> str:
+        return self._call("function() { return this.innerText; }") or ''
+
+    @property
+    def tag_name(self) -> str:
+        return (self._call("function() { return this.tagName; }") or '').lower()
+
+    def get_attribute(self, name: str):
+        return self._call(ATTRIBUTE_SCRIPT, name)
+
+    def is_displayed(self) -> bool:
+        return bool(self._call("function() { return !!(this.offsetWidth || this.offsetHeight "
+                               "|| this.getClientRects().length); }"))
+
+    def is_enabled(self) -> bool:
+        return not self._call("function() { return !!this.disabled; }")
+
+    def click(self) -> None:
+        self._call("function() { this.scrollIntoView({block: 'center'}); this.click(); }")
+
+    def clear(self) -> None:
+        self._call("function() { this.value = ''; this.dispatchEvent(new Event('input', {bubbles: true})); }")
+
+    def send_keys(self, *value) -> None:
+        text: str = ''.join(map(str, value))
+        if self._call("function() { return this.type === 'file'; }"):
+            self._driver._execute('sendKeysToElement', self._driver.tab.set_files(self.object_id, text.split('\n')))
+        else:
+            self._driver._execute('sendKeysToElement', self._driver.tab.insert_text(self.object_id, text))
+
+    def find_element(self, by=By.ID, value=None):
+        return self._driver._find(by, value, within=self.object_id, single=True)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._driver._find(by, value, within=self.object_id)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, CDPElement) and other.object_id == self.object_id
+
+    def __hash__(self) -> int:
+        return hash(self.object_id)
+
+
+class CDPDriver:
+    """The WebDriver subset the bot uses, on a tab of a CDPHost.
+
+    Every call is run as a coroutine on the host's event loop and waited
+    for, so bot code keeps its blocking style while the tabs of all bots in
+    the process share one connection. `execute` is the single entry point,
+    which keeps Metrics.instrument_driver working.
+    """
+
+    def __init__(self, host: CDPHost, tab: CDPTab) -> None:
+        self.host = host
+        self.tab = tab
+        self.script_timeout: float = 30
+        self.page_load_timeout: float = 30
+
+    def execute(self, driver_command: str, coroutine):
+        return self.host.run(coroutine)
+
+    def _execute(self, driver_command: str, coroutine):
+        # through self.execute so instrumentation sees every command
+        return self.execute(driver_command, coroutine)
+
+    def get(self, url: str) -> None:
+        self._execute('get', self.tab.navigate(url, self.page_load_timeout))
+
+    def refresh(self) -> None:
+        self._execute('refresh', self.tab.reload(self.page_load_timeout))
+
+    @property
+    def current_url(self) -> str:
+        return self._execute('getCurrentUrl', self.tab.evaluate("location.href"))
+
+    @property
+    def title(self) -> str:
+        return self._execute('getTitle', self.tab.evaluate("document.title"))
+
+    @property
+    def page_source(self) -> str:
+        return self._execute('getPageSource', self.tab.evaluate("document.documentElement.outerHTML"))
+
+    def execute_script(self, script: str, *args):
+        return self._execute('executeScript', self.tab.run_script(script, *args))
+
+    def execute_async_script(self, script: str, *args):
+        return self._execute('executeAsyncScript',
+                             self.tab.run_async_script(script, *args, timeout=self.script_timeout))
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict):
+        if cmd.startswith("Target."):
+            # targets belong to the browser, not to this tab's session
+            return self._execute('executeCdpCommand', self.tab.connection.send(cmd, cmd_args))
+        return self._execute('executeCdpCommand', self.tab.send(cmd, cmd_args))
+
+    def wait_for_event(self, method: str, predicate=None, timeout: float = 30) -> dict:
+        """Block until the tab emits a DevTools event, e.g. Page.loadEventFired"""
+        return self._execute('waitForEvent', self.tab.wait_for(method, predicate, timeout))
+
+    def set_script_timeout(self, timeout: float) -> None:
+        self.script_timeout = timeout
+
+    def set_page_load_timeout(self, timeout: float) -> None:
+        self.page_load_timeout = timeout
+
+    def find_element(self, by=By.ID, value=None):
+        return self._find(by, value, single=True)
+
+    def find_elements(self, by=By.ID, value=None) -> list:
+        return self._find(by, value)
+
+    def get_cookies(self) -> list:
+        return self._execute('getAllCookies', self.tab.send("Network.getCookies"))["cookies"]
+
+    def add_cookie(self, cookie: dict) -> None:
+        params: dict = dict(cookie)
+        if "expiry" in params:
+            params["expires"] = params.pop("expiry")
+        # Network.getCookies reports session cookies as expires -1, setting that would expire them at once
+        if params.pop("session", False) or params.get("expires", 0) < 0:
+            params.pop("expires", None)
+        if "domain" not in params:
+            params["url"] = self.current_url
+        self._execute('addCookie', self.tab.send("Network.setCookie", params))
+
+    def delete_all_cookies(self) -> None:
+        self._execute('deleteAllCookies', self.tab.send("Network.clearBrowserCookies"))
+
+    def save_screenshot(self, filename: str) -> bool:
+        try:
+            self._execute('screenshot', self.tab.screenshot(filename))
+            return True
+        except Exception as e:
+            log.debug(f"Screenshot failed: {e}")
+            return False
+
+    def set_window_size(self, width: int, height: int) -> None:
+        # tabs share the browser window, there is nothing to resize per tab
+        pass
+
+    def set_window_position(self, x: int, y: int) -> None:
+        pass
+
+    @property
+    def current_window_handle(self) -> str:
+        return self.tab.target_id
+
+    @property
+    def window_handles(self) -> list:
+        targets: list = self.execute_cdp_cmd("Target.getTargets", {})["targetInfos"]
+        return [target["targetId"] for target in targets if target["type"] == "page"]
+
+    @property
+    def switch_to(self) -> CDPSwitchTo:
+        return CDPSwitchTo(self)
+
+    def close(self) -> None:
+        """Close the current tab, switch_to.window another one before the next command"""
+        self._execute('closeWindow', self.tab.close())
+
+    def quit(self) -> None:
+        self.host.release(self)
+
+    def _find(self, by, value, within: str | None = None, single: bool = False):
+        ids: list = self._execute('findElements', self.tab.find(by, value, within))
+        if single:
+            if not ids:
+                raise NoSuchElementException(f"{by}={value}")
+            return CDPElement(self, ids[0])
+        return [CDPElement(self, object_id) for object_id in ids]
+
+
+class CDPSwitchTo:
+    """driver.switch_to, for moving a CDPDriver to another tab"""
+
+    def __init__(self, driver: CDPDriver) -> None:
+        self.driver = driver
+
+    def window(self, handle: str) -> None:
+        driver: CDPDriver = self.driver
+        driver.tab = driver._execute('switchToWindow', CDPTab.attach(driver.tab.connection, handle))
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import logging
+import os
+
+import yaml
+
+from qa_engine import VARIABLES, unknown_placeholders
+
+log = logging.getLogger(__name__)
+
+REQUIRED = ['username', 'password', 'phone_number']
+EXPERIENCE_LEVELS = range(1, 7)
+OUTPUT_FORMATS = ('csv', 'jsonl', 'parquet')
+JOB_SOURCES = ('browser', 'guest')
+BROWSER_BACKENDS = ('selenium', 'cdp')
+
+
+def load_config(path: str = "config.yaml") -> dict:
+    with open(path, 'r') as stream:
+        parameters = yaml.safe_load(stream)
+    if not isinstance(parameters, dict):
+        raise ValueError(f"{path} does not contain a mapping of settings")
+    return parameters
+
+
+def validate_config(parameters: dict) -> list:
+    """Problems found in the config, an empty list means it is usable"""
+    errors: list = []
+    for key in ('positions', 'locations'):
+        values = parameters.get(key)
+        if not isinstance(values, list) or not [v for v in values if v is not None]:
+            errors.append(f"'{key}' must be a non-empty list")
+    for key in REQUIRED:
+        if parameters.get(key) is None:
+            errors.append(f"'{key}' is required")
+
+    uploads = parameters.get('uploads')
+    if isinstance(uploads, list):
+        errors.append("uploads read from the config file appear to be in list format"
+                      " while should be dict. Try removing '-' from line containing filename & path")
+    elif isinstance(uploads, dict):
+        for key, value in uploads.items():
+            if value is None:
+                errors.append(f"upload '{key}' has no value")
+        for resume in uploads.get('resumes') or []:
+            if not os.path.exists(str(resume.get('path'))):
+                log.warning(f"Resume file not found: {resume.get('path')}")
+
+    for level in parameters.get('experience_level') or []:
+        if level not in EXPERIENCE_LEVELS:
+            errors.append(f"experience_level {level} must be between 1 and 6")
+    # salary and rate are typed into forms as written, "30k-40k" is fine
+    for key in ('days_old', 'distance', 'rate_limit'):
+        value = parameters.get(key)
+        if value is not None and not isinstance(value, (int, float)):
+            errors.append(f"'{key}' must be a number")
+    for key in ('workers', 'max_form_steps'):
+        value = parameters.get(key, 1)
+        if not isinstance(value, int) or value < 1:
+            errors.append(f"'{key}' must be a positive integer")
+    size = (parameters.get('tab_pool') or {}).get('size', 0)
+    if not isinstance(size, int) or size < 0:
+        errors.append("tab_pool.size must be a non-negative integer")
+    output_format = (parameters.get('results') or {}).get('format', 'csv')
+    if output_format not in OUTPUT_FORMATS:
+        errors.append(f"results.format must be one of {', '.join(OUTPUT_FORMATS)}")
+    backend = (parameters.get('job_source') or {}).get('backend', 'browser')
+    if backend not in JOB_SOURCES:
+        errors.append(f"job_source.backend must be one of {', '.join(JOB_SOURCES)}")
+    driver = (parameters.get('browser') or {}).get('backend', 'selenium')
+    if driver not in BROWSER_BACKENDS:
+        errors.append(f"browser.backend must be one of {', '.join(BROWSER_BACKENDS)}")
+    for rule in parameters.get('qa_rules') or []:
+        if not isinstance(rule, dict) or 'match' not in rule or 'answer' not in rule:
+            errors.append(f"qa_rules entry {rule!r} needs 'match' and 'answer'")
+        elif isinstance(rule['answer'], (dict, list)):
+            errors.append(f"qa_rules answer for '{rule['match']}' must be a single value")
+        elif unknown_placeholders(rule['answer']):
+            errors.append(f"qa_rules answer for '{rule['match']}' uses unknown placeholders "
+                          f"{', '.join('{' + name + '}' for name in unknown_placeholders(rule['answer']))}, "
+                          f"only {', '.join('{' + name + '}' for name in VARIABLES)} are filled in")
+    return errors
+
+
+def output_filename(parameters: dict) -> str:
+    """output_filename may be a string or a one-item list"""
+    value = parameters.get('output_filename') or 'output.csv'
+    if isinstance(value, list):
+        value = next((f for f in value if f is not None), 'output.csv')
+    return value
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+
+log = logging.getLogger(__name__)
+
+MODAL_SELECTOR = ".jobs-easy-apply-modal, [role='dialog']"
+BUTTONS = {
+    "next": "button[aria-label='Continue to next step']",
+    "review": "button[aria-label='Review your application']",
+    "submit": "button[aria-label='Submit application']",
+    "follow": "label[for='follow-company-checkbox']",
+}
+GROUPING_SELECTOR = ".jobs-easy-apply-form-section__grouping"
+ERROR_SELECTOR = ".artdeco-inline-feedback__message"
+RESUME_INPUT = "input[type='file'][id*='resume']"
+COVER_LETTER_INPUT = "input[type='file'][id*='cover-letter']"
+
+# Everything send_resume needs to decide on one step of the Easy Apply modal,
+# read in a single round-trip.
+SNAPSHOT_SCRIPT = """
+const [modalSelector, buttons, groupingSelector, errorSelector, resumeInput, coverLetterInput] = arguments;
+const modal = document.querySelector(modalSelector);
+const root = modal || document.body;
+const text = root.innerText || '';
+const present = {};
+for (const [name, selector] of Object.entries(buttons)) present[name] = !!root.querySelector(selector);
+const empty = Array.from(root.querySelectorAll(groupingSelector)).filter(group => {
+    const radios = group.querySelectorAll("input[type='radio']");
+    if (radios.length) return !Array.from(radios).some(radio => radio.checked);
+    const input = group.querySelector("input:not([type='file']):not([type='checkbox']), textarea, select");
+    return !!input && !input.value;
+}).length;
+return {
+    open: !!modal,
+    buttons: present,
+    upload_resume: !!root.querySelector(resumeInput) && /Upload resume/i.test(text),
+    upload_cover_letter: !!root.querySelector(coverLetterInput),
+    errors: Array.from(root.querySelectorAll(errorSelector)).map(el => el.innerText.trim()).filter(Boolean),
+    empty_fields: empty,
+    sent: /application was sent/i.test(text),
+};
+"""
+
+# Clicks the first element matching a selector, false if there is none.
+CLICK_SCRIPT = """
+const el = document.querySelector(arguments[0]);
+if (el) el.click();
+return !!el;
+"""
+
+
+@dataclass
+class FormStep:
+    """State of the Easy Apply modal at one step"""
+    open: bool = False
+    buttons: dict = field(default_factory=dict)
+    upload_resume: bool = False
+    upload_cover_letter: bool = False
+    errors: list = field(default_factory=list)
+    empty_fields: int = 0
+    sent: bool = False
+
+    def has(self, button: str) -> bool:
+        return bool(self.buttons.get(button))
+
+
+def snapshot(browser) -> FormStep:
+    raw: dict = browser.execute_script(SNAPSHOT_SCRIPT, MODAL_SELECTOR, BUTTONS, GROUPING_SELECTOR,
+                                       ERROR_SELECTOR, RESUME_INPUT, COVER_LETTER_INPUT) or {}
+    return FormStep(**raw)
+
+
+def click(browser, button: str) -> bool:
+    """Click one of BUTTONS in a single script call"""
+    return bool(browser.execute_script(CLICK_SCRIPT, BUTTONS[button]))
+
+
+# Label, kind, options and current value of every question on the current step.
+FIELDS_SCRIPT = """
+const [modalSelector, groupingSelector] = arguments;
+const root = document.querySelector(modalSelector) || document.body;
+return Array.from(root.querySelectorAll(groupingSelector)).map((group, index) => {
+    // radio groups label themselves with a legend, their <label>s are the options
+    const label = group.querySelector('legend') || group.querySelector('label');
+    const radios = Array.from(group.querySelectorAll("input[type='radio']"));
+    const select = group.querySelector('select');
+    const input = group.querySelector("input:not([type='file']):not([type='checkbox']):not([type='radio']), textarea");
+    let type = 'other', options = [], value = '';
+    if (radios.length) {
+        type = 'radio';
+        options = radios.map(radio => radio.value);
+        const checked = radios.find(radio => radio.checked);
+        value = checked ? checked.value : '';
+    } else if (select) {
+        type = 'select';
+        options = Array.from(select.options).map(option => option.text.trim());
+        value = select.selectedIndex > 0 ? select.value : '';
+    } else if (input) {
+        type = input.tagName === 'TEXTAREA' ? 'textarea' : 'text';
+        value = input.value;
+    }
+    return {index: index, label: (label || group).innerText.trim(), type: type, options: options, value: value};
+});
+"""
+
+# Applies {grouping index: answer} and fires the events the form listens for,
+# returns the indexes that could not be filled.
+FILL_SCRIPT = """
+const [modalSelector, groupingSelector, values] = arguments;
+const root = document.querySelector(modalSelector) || document.body;
+const groups = root.querySelectorAll(groupingSelector);
+const fire = (el, ...types) => types.forEach(type => el.dispatchEvent(new Event(type, {bubbles: true})));
+const missed = [];
+for (const [index, value] of Object.entries(values)) {
+    const group = groups[Number(index)];
+    const wanted = String(value).trim().toLowerCase();
+    const radios = group ? Array.from(group.querySelectorAll("input[type='radio']")) : [];
+    const select = group && group.querySelector('select');
+    const input = group && group.querySelector(
+        "input:not([type='file']):not([type='checkbox']):not([type='radio']), textarea");
+    if (radios.length) {
+        const text = radio => ((radio.labels && radio.labels[0] && radio.labels[0].innerText) || '').trim().toLowerCase();
+        const radio = radios.find(radio => radio.value.trim().toLowerCase() === wanted || text(radio) === wanted);
+        if (radio) { radio.click(); fire(radio, 'change'); } else missed.push(Number(index));
+    } else if (select) {
+        const option = Array.from(select.options).find(
+            option => option.text.trim().toLowerCase() === wanted || option.value.toLowerCase() === wanted);
+        if (option) { select.value = option.value; fire(select, 'input', 'change'); } else missed.push(Number(index));
+    } else if (input) {
+        // the native setter keeps framework-controlled inputs in sync with the new value
+        const proto = input.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(input, String(value));
+        fire(input, 'input', 'change', 'blur');
+    } else {
+        missed.push(Number(index));
+    }
+}
+return missed;
+"""
+
+
+@dataclass
+class FormField:
+    """One question on the current step of the form"""
+    index: int
+    label: str
+    type: str = "other"
+    options: list = field(default_factory=list)
+    value: str = ""
+
+
+def read_fields(browser) -> list:
+    """Every question of the current step in one script call"""
+    raw: list = browser.execute_script(FIELDS_SCRIPT, MODAL_SELECTOR, GROUPING_SELECTOR) or []
+    return [FormField(**item) for item in raw]
+
+
+def fill_fields(browser, values: dict) -> list:
+    """Fill {field index: answer} in one script call, returns the indexes left unfilled"""
+    if not values:
+        return []
+    return browser.execute_script(FILL_SCRIPT, MODAL_SELECTOR, GROUPING_SELECTOR,
+                                  {str(index): str(value) for index, value in values.items()}) or []
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+
+log = logging.getLogger(__name__)
+
+# Collects every card on the results page in a single driver round-trip.
+HARVEST_SCRIPT = """
+const pick = (card, selectors) => {
+    for (const selector of selectors) {
+        const el = card.querySelector(selector);
+        if (el && el.innerText.trim()) return el.innerText.trim();
+    }
+    return '';
+};
+return Array.from(document.querySelectorAll(arguments[0])).map(card => {
+    const text = card.innerText || '';
+    return {
+        job_id: card.getAttribute('data-job-id')
+            || (card.closest('[data-job-id]') || card).getAttribute('data-job-id') || '',
+        title: pick(card, arguments[1].title),
+        company: pick(card, arguments[1].company),
+        location: pick(card, arguments[1].location),
+        applied: /\\bApplied\\b/.test(text),
+        text: text,
+    };
+});
+"""
+
+# Text of the "1,234 results" line above the results list.
+RESULT_COUNT_SCRIPT = """
+for (const selector of arguments[0]) {
+    const el = document.querySelector(selector);
+    if (el && el.innerText.trim()) return el.innerText;
+}
+return null;
+"""
+
+RESULT_COUNT_SELECTORS = [".jobs-search-results-list__subtitle", ".jobs-search-results-list__text",
+                          ".jobs-search-results-list__title-heading small"]
+
+FIELD_SELECTORS = {
+    "title": [".job-card-list__title", ".job-card-container__link strong", "a.job-card-container__link"],
+    "company": [".artdeco-entity-lockup__subtitle", ".job-card-container__primary-description",
+                ".job-card-container__company-name"],
+    "location": [".job-card-container__metadata-item", ".artdeco-entity-lockup__caption"],
+}
+
+
+@dataclass
+class JobCard:
+    job_id: str
+    title: str
+    company: str = ""
+    location: str = ""
+    applied: bool = False
+    text: str = ""
+
+    @property
+    def label(self) -> str:
+        """Title used for blacklist checks, falls back to the full card text"""
+        return self.title or self.text
+
+
+def harvest_job_cards(browser, selector: str = "div.job-card-container") -> list:
+    """Read all job cards with one execute_script call"""
+    raw: list = browser.execute_script(HARVEST_SCRIPT, selector, FIELD_SELECTORS) or []
+    return [JobCard(**card) for card in raw if card.get("job_id")]
+
+
+def parse_job_cards(page_source: str, selector: str = "div.job-card-container") -> list:
+    """Same as harvest_job_cards but from an already fetched page_source"""
+    from bs4 import BeautifulSoup
+
+    def pick(card, selectors) -> str:
+        for css in selectors:
+            el = card.select_one(css)
+            if el and el.get_text(strip=True):
+                return el.get_text(" ", strip=True)
+        return ""
+
+    cards: list = []
+    for card in BeautifulSoup(page_source, "lxml").select(selector):
+        holder = card if card.get("data-job-id") else card.find_parent(attrs={"data-job-id": True})
+        job_id: str = holder.get("data-job-id", "") if holder else ""
+        if not job_id:
+            continue
+        text: str = card.get_text(" ", strip=True)
+        cards.append(JobCard(job_id=job_id,
+                             title=pick(card, FIELD_SELECTORS["title"]),
+                             company=pick(card, FIELD_SELECTORS["company"]),
+                             location=pick(card, FIELD_SELECTORS["location"]),
+                             applied="Applied" in text.split(),
+                             text=text))
+    return cards
+
+
+def result_count(browser) -> int | None:
+    """Total number of results shown on the search page, None if it is not there"""
+    text = browser.execute_script(RESULT_COUNT_SCRIPT, RESULT_COUNT_SELECTORS)
+    found = re.search(r"\d[\d,.]*", text or "")
+    return int(re.sub(r"\D", "", found.group())) if found else None
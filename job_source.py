@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import logging
+from urllib.parse import quote, urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from job_cards import JobCard, result_count
+
+log = logging.getLogger(__name__)
+
+PAGE_SIZE = 25
+SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+# logged-out endpoint serving the same results as <li> fragments, PAGE_SIZE per request
+GUEST_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+USER_AGENT = ("Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) "
+              "Chrome/124.0 Safari/537.36")
+
+
+def search_params(position, location, start=0, experience_level=(), days_old=3, distance=8) -> dict:
+    """Query parameters of a job search, shared by the browser and the guest API"""
+    params: dict = {"keywords": position, "location": location, "start": start}
+    if days_old:
+        # r259200 means the last 3 days in seconds
+        params["f_TPR"] = f"r{days_old * 86400}"
+    if distance and "remote" not in location.lower():
+        params["distance"] = distance
+    params["f_AL"] = "true"  # Easy Apply only
+    if experience_level:
+        params["f_E"] = ",".join(map(str, experience_level))
+    params["f_JT"] = "F"  # Full-time
+    return params
+
+
+def search_url(params: dict, base: str = SEARCH_URL) -> str:
+    return f"{base}?{urlencode(params, quote_via=quote, safe=',')}"
+
+
+def parse_guest_cards(html: str) -> list:
+    """JobCards from a guest API fragment"""
+    from lxml import html as lxml_html
+
+    if not html.strip():
+        return []
+
+    def pick(node, xpath: str) -> str:
+        found = node.xpath(xpath)
+        return " ".join(found[0].text_content().split()) if found else ""
+
+    cards: list = []
+    for node in lxml_html.fragment_fromstring(html, create_parent="ul").xpath(".//*[@data-entity-urn]"):
+        job_id: str = node.get("data-entity-urn", "").rsplit(":", 1)[-1]
+        if not job_id.isdigit():
+            continue
+        cards.append(JobCard(job_id=job_id,
+                             title=pick(node, ".//*[contains(@class, 'base-search-card__title')]"),
+                             company=pick(node, ".//*[contains(@class, 'base-search-card__subtitle')]"),
+                             location=pick(node, ".//*[contains(@class, 'job-search-card__location')]"),
+                             text=" ".join(node.text_content().split())))
+    return cards
+
+
+class JobSource:
+    """Where search results come from.
+
+    `search` returns the JobCards of the results page starting at `start`,
+    an empty list past the last page, and raises if the page could not be
+    loaded. Sources with `uses_browser` unset do not touch the bot's
+    browser, so it is only needed to apply.
+    """
+
+    uses_browser = True
+
+    def search(self, position, location, start=0, days_old=3, distance=8) -> list:
+        raise NotImplementedError
+
+    def result_count(self) -> int | None:
+        """Total results of the last search, None when the source cannot tell"""
+        return None
+
+    def close(self) -> None:
+        pass
+
+
+class BrowserJobSource(JobSource):
+    """Loads the logged-in search page and reads the cards from the DOM"""
+
+    def __init__(self, bot) -> None:
+        self.bot = bot
+
+    def search(self, position, location, start=0, days_old=3, distance=8) -> list:
+        _, next_start = self.bot.next_jobs_page(position, location, start,
+                                                experience_level=self.bot.experience_level,
+                                                days_old=days_old, distance=distance)
+        if next_start == start:
+            raise RuntimeError("search page did not load")
+        return self.bot.get_job_cards()
+
+    def result_count(self) -> int | None:
+        try:
+            return result_count(self.bot.browser)
+        except Exception as e:
+            log.debug(f"Could not read the result count: {e}")
+            return None
+
+
+class GuestJobSource(JobSource):
+    """Fetches result fragments over HTTP from the guest API.
+
+    A single pooled requests.Session keeps connections alive between pages
+    and retries throttled or failed requests with backoff. Guest results do
+    not know which jobs were already applied to, that is left to the
+    AppliedStore as for every other card.
+    """
+
+    uses_browser = False
+
+    def __init__(self, experience_level=(), url: str = GUEST_URL, timeout: float = 10,
+                 pool_size: int = 4, retries: int = 3, session: requests.Session | None = None) -> None:
+        self.experience_level = experience_level
+        self.url = url
+        self.timeout = timeout
+        if session is None:
+            session = requests.Session()
+            # requests sends its own python-requests agent unless told otherwise
+            session.headers["User-Agent"] = USER_AGENT
+        self.session = session
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                              max_retries=Retry(total=retries, backoff_factor=0.5,
+                                                status_forcelist=(429, 500, 502, 503, 504)))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def search(self, position, location, start=0, days_old=3, distance=8) -> list:
+        params: dict = search_params(position, location, start, self.experience_level, days_old, distance)
+        response = self.session.get(self.url, params=params, timeout=self.timeout)
+        if response.status_code in (400, 404):
+            # asked for a page past the last result
+            return []
+        response.raise_for_status()
+        return parse_guest_cards(response.text)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def make_job_source(bot, config: dict) -> JobSource:
+    """JobSource for `job_source:` in config.yaml, the browser unless backend is 'guest'"""
+    options: dict = dict(config or {})
+    backend: str = options.pop("backend", "browser")
+    if backend == "guest":
+        return GuestJobSource(experience_level=bot.experience_level, **options)
+    return BrowserJobSource(bot)
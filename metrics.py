@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+log = logging.getLogger(__name__)
+
+# seconds, tuned for browser work: sub-second lookups up to multi-minute forms
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+
+class Histogram:
+
+    def __init__(self, buckets=BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts: list = [0] * (len(buckets) + 1)
+        self.total: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += value
+        self.count += 1
+
+    def summary(self) -> dict:
+        return {"count": self.count, "sum": round(self.total, 3),
+                "avg": round(self.total / self.count, 3) if self.count else 0.0}
+
+
+class Metrics:
+    """Named spans, counters and histograms for the bot's stages.
+
+    Spans time a stage into a per-stage histogram, WebDriver commands are
+    counted by wrapping the driver's `execute`, and everything can be dumped
+    as a JSON summary or Prometheus text. Both exporters are optional and run
+    on daemon threads.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.stages: dict = {}
+        self.counters: dict = {}
+        self.started: float = time.time()
+        self.server = None
+
+    @contextmanager
+    def span(self, name: str):
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self.lock:
+            self.stages.setdefault(name, Histogram()).observe(seconds)
+
+    def inc(self, name: str, value: int = 1) -> None:
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def instrument_driver(self, browser) -> None:
+        """Count every command sent to the WebDriver"""
+        execute = getattr(browser, 'execute', None)
+        if execute is None or getattr(execute, '_counted', False):
+            return
+
+        @functools.wraps(execute)
+        def counted(driver_command, *args, **kwargs):
+            self.inc('webdriver_commands')
+            self.inc(f'webdriver_command:{driver_command}')
+            return execute(driver_command, *args, **kwargs)
+
+        counted._counted = True
+        browser.execute = counted
+
+    def summary(self) -> dict:
+        with self.lock:
+            return {
+                "uptime": round(time.time() - self.started, 1),
+                "stages": {name: hist.summary() for name, hist in self.stages.items()},
+                "counters": dict(self.counters),
+            }
+
+    def prometheus(self) -> str:
+        lines: list = []
+        with self.lock:
+            lines.append("# TYPE easyapply_stage_seconds histogram")
+            for name, hist in sorted(self.stages.items()):
+                cumulative = 0
+                for bound, count in zip(hist.buckets, hist.counts):
+                    cumulative += count
+                    lines.append(f'easyapply_stage_seconds_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'easyapply_stage_seconds_bucket{{stage="{name}",le="+Inf"}} {hist.count}')
+                lines.append(f'easyapply_stage_seconds_sum{{stage="{name}"}} {hist.total}')
+                lines.append(f'easyapply_stage_seconds_count{{stage="{name}"}} {hist.count}')
+            lines.append("# TYPE easyapply_events_total counter")
+            for name, value in sorted(self.counters.items()):
+                event, _, label = name.partition(':')
+                labels: str = f'event="{event}"' + (f',detail="{label}"' if label else '')
+                lines.append(f'easyapply_events_total{{{labels}}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def write_summary(self, filename: str) -> None:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def export_summary(self, filename: str, interval: float = 60) -> None:
+        """Rewrite the JSON summary file every `interval` seconds"""
+        def loop() -> None:
+            while True:
+                time.sleep(interval)
+                try:
+                    self.write_summary(filename)
+                except OSError as e:
+                    log.error(f"Could not write metrics summary {filename}: {e}")
+
+        threading.Thread(target=loop, name="metrics-summary", daemon=True).start()
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> None:
+        """Serve Prometheus text format on http://host:port/metrics"""
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.rstrip('/') not in ('', '/metrics'):
+                    self.send_error(404)
+                    return
+                body: bytes = metrics.prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self.server.serve_forever, name="metrics-http", daemon=True).start()
+        log.info(f"Serving metrics on http://{host}:{port}/metrics")
+
+    @classmethod
+    def from_config(cls, config: dict) -> Metrics:
+        metrics = cls()
+        if config.get('summary_file'):
+            metrics.export_summary(config['summary_file'], config.get('interval', 60))
+        if config.get('port'):
+            metrics.serve(config['port'], config.get('host', '127.0.0.1'))
+        return metrics
+
+
+def timed(stage: str):
+    """Method decorator recording the call as a span on `self.metrics`"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.span(stage):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
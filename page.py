@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+
+class LazyPage:
+    """Page source that is only fetched and parsed when something reads it.
+
+    Attribute access is passed on to the BeautifulSoup document, so callers
+    can use it like the soup load_page used to return. Nothing is read from
+    the browser until the first access.
+    """
+
+    def __init__(self, browser) -> None:
+        self.browser = browser
+        self._soup = None
+
+    @property
+    def soup(self):
+        if self._soup is None:
+            from bs4 import BeautifulSoup
+            self._soup = BeautifulSoup(self.browser.page_source, "lxml")
+        return self._soup
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.soup, name)
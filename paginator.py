@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from job_source import PAGE_SIZE
+
+log = logging.getLogger(__name__)
+
+# LinkedIn never serves results past this offset
+MAX_RESULTS = 1000
+
+
+class Paginator:
+    """Walks the result pages of one search and yields the fresh cards of each.
+
+    `search(start)` returns the cards of the page at `start`, `fresh(cards)`
+    filters them down to jobs worth applying to. After the first page
+    `count()` is asked once for the total number of results, which bounds the
+    page range so the search never pages past the end. A page without cards
+    after the first ends the search, a page without fresh cards is skipped instead of being
+    loaded again, and `max_stale` such pages in a row end it too.
+
+    Paging begins at offset `start`, to resume a search that was cut short.
+
+    A page whose `search` raises is tried `retries` more times. If it still
+    fails the search stops with `stopped` set to "error" and the exception in
+    `error`, so a dead browser is never mistaken for a finished search. After
+    a full iteration `stopped` says why it ended: "end", "stale", "deadline"
+    or "error"; it stays None when the caller stops early.
+
+    With `prefetch` > 0 that many pages are fetched ahead on a thread pool
+    while the caller works through the current one. Only use it with a
+    search that does not share the caller's browser.
+    """
+
+    def __init__(self, search, fresh, count=None, page_size: int = PAGE_SIZE, prefetch: int = 0,
+                 max_stale: int = 3, deadline: float | None = None, start: int = 0, retries: int = 1) -> None:
+        self.search = search
+        self.fresh = fresh
+        self.count = count
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self.max_stale = max_stale
+        self.deadline = deadline
+        self.start = start
+        self.retries = retries
+        self.total: int | None = None
+        self.limit: int = MAX_RESULTS
+        self.stopped: str | None = None
+        self.error: Exception | None = None
+        self.stats: dict = {"pages": 0, "stale": 0, "unused": 0, "failed": 0}
+
+    def __iter__(self):
+        pool = ThreadPoolExecutor(self.prefetch, thread_name_prefix="prefetch") if self.prefetch else None
+        pending: deque = deque()
+        next_start = self.start
+        stale = 0
+        try:
+            while True:
+                while next_start < self.limit and len(pending) < max(1, self.prefetch):
+                    pending.append((next_start, pool.submit(self.search, next_start) if pool else None))
+                    next_start += self.page_size
+                if not pending:
+                    self.stopped = "end"
+                    break
+                if self.deadline is not None and time.time() > self.deadline:
+                    log.info("Stopping search - out of time")
+                    self.stopped = "deadline"
+                    break
+
+                start, future = pending.popleft()
+                try:
+                    cards: list = future.result() if future else self.search(start)
+                except Exception as e:
+                    cards = self._retry(start, e)
+                    if cards is None:
+                        self.stopped = "error"
+                        break
+                self.stats["pages"] += 1
+
+                if self.stats["pages"] == 1 and self.count is not None:
+                    self._bound(self.count())
+                    for entry in [entry for entry in pending if entry[0] >= self.limit]:
+                        pending.remove(entry)
+                        self._cancel(entry[1])
+                # the first page may come back empty because it had not rendered yet, that one is only stale
+                if not cards and self.stats["pages"] > 1:
+                    log.info(f"No more results after offset {start}")
+                    self.stopped = "end"
+                    break
+
+                jobs: list = self.fresh(cards)
+                if jobs:
+                    stale = 0
+                    yield start, jobs
+                    continue
+                stale += 1
+                self.stats["stale"] += 1
+                if stale >= self.max_stale:
+                    log.info(f"Stopping search - {stale} pages in a row without new jobs")
+                    self.stopped = "stale"
+                    break
+        finally:
+            for _, future in pending:
+                self._cancel(future)
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def finished(self) -> bool:
+        """True when the search ran to its end, out of fresh pages or out of time, not when it failed"""
+        return self.stopped in ("end", "stale", "deadline")
+
+    def _retry(self, start: int, error: Exception) -> list | None:
+        """Cards of the page at `start` after it failed with `error`, None if every retry fails too"""
+        for attempt in range(self.retries):
+            log.warning(f"Search page at offset {start} failed ({error}), retrying")
+            try:
+                return self.search(start)
+            except Exception as e:
+                error = e
+        log.error(f"Search page at offset {start} failed, stopping the search: {error}")
+        self.stats["failed"] += 1
+        self.error = error
+        return None
+
+    def _bound(self, total: int | None) -> None:
+        if total is None:
+            return
+        self.total = total
+        self.limit = min(MAX_RESULTS, total)
+        log.info(f"{total} results, {math.ceil(self.limit / self.page_size)} pages to search")
+
+    def _cancel(self, future) -> None:
+        if future is not None:
+            future.cancel()
+            self.stats["unused"] += 1
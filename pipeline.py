@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import threading
+
+from atomic_file import write_json_atomic
+
+log = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class JobPipeline:
+    """Producer/consumer pipeline between job discovery and application.
+
+    `discover()` returns an iterable of job IDs and runs on a background
+    thread, feeding a bounded queue: when the applier falls behind the queue
+    fills up and discovery blocks, and when discovery falls behind the
+    applier blocks on the empty queue. IDs that were queued but not yet
+    applied to are checkpointed so an interrupted run resumes with them.
+    """
+
+    def __init__(self, discover, apply, maxsize: int = 25, checkpoint: str | None = None) -> None:
+        self.discover = discover
+        self.apply = apply
+        self.queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self.checkpoint = checkpoint
+        self.lock = threading.Lock()
+        self.pending: list = self._load_checkpoint()
+        self.seen: set = set(self.pending)
+        self.stop = threading.Event()
+        self.error: Exception | None = None
+
+    def run(self) -> int:
+        """Apply to every discovered job, returns the number of jobs processed"""
+        resumed: list = list(self.pending)
+        if resumed:
+            log.info(f"Resuming {len(resumed)} queued jobs from {self.checkpoint}")
+
+        producer = threading.Thread(target=self._produce, name="discovery", daemon=True)
+        producer.start()
+
+        processed = 0
+        try:
+            for jobID in resumed:
+                self._process(jobID)
+                processed += 1
+            while True:
+                jobID = self.queue.get()
+                if jobID is _DONE:
+                    break
+                self._process(jobID)
+                processed += 1
+        finally:
+            self.stop.set()
+            # unblock the producer if it is waiting on a full queue
+            while producer.is_alive():
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+                producer.join(timeout=0.1)
+
+        if self.error is not None:
+            log.error(f"Discovery stopped early: {self.error}")
+        return processed
+
+    def upcoming(self, limit: int = 5) -> list:
+        """Up to `limit` job IDs waiting in the queue, next first"""
+        with self.queue.mutex:
+            return [jobID for jobID in list(self.queue.queue)[:limit] if jobID is not _DONE]
+
+    def _produce(self) -> None:
+        try:
+            for jobID in self.discover():
+                if self.stop.is_set():
+                    return
+                with self.lock:
+                    if jobID in self.seen:
+                        continue
+                    self.seen.add(jobID)
+                    self.pending.append(jobID)
+                    self._save_checkpoint()
+                while not self.stop.is_set():
+                    try:
+                        self.queue.put(jobID, timeout=1)
+                        break
+                    except queue.Full:
+                        continue
+        except Exception as e:
+            self.error = e
+        finally:
+            if not self.stop.is_set():
+                self.queue.put(_DONE)
+
+    def _process(self, jobID) -> None:
+        try:
+            self.apply(jobID)
+        except Exception as e:
+            # a job that fails is not retried, anything worse leaves it pending
+            log.error(f"Failed to process {jobID}: {e}")
+        with self.lock:
+            if jobID in self.pending:
+                self.pending.remove(jobID)
+            self._save_checkpoint()
+
+    def _load_checkpoint(self) -> list:
+        if not self.checkpoint or not os.path.isfile(self.checkpoint):
+            return []
+        try:
+            with open(self.checkpoint, encoding='utf-8') as f:
+                return list(json.load(f).get('pending', []))
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable checkpoint {self.checkpoint}: {e}")
+            return []
+
+    def _save_checkpoint(self) -> None:
+        if not self.checkpoint:
+            return
+        try:
+            write_json_atomic(self.checkpoint, {'pending': self.pending})
+        except OSError as e:
+            # losing one checkpoint write is better than abandoning the combo
+            log.warning(f"Could not write checkpoint {self.checkpoint}: {e}")
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from collections import OrderedDict
+
+log = logging.getLogger(__name__)
+
+# (words, answer) checked in order, the first rule whose words appear in the
+# question wins. Answers may use {salary} and {rate}.
+DEFAULT_RULES = [
+    ("how many", "1"),
+    ("experience", "1"),
+    ("sponsor", "No"),
+    ("visa", "No"),
+    ("do you", "Yes"),
+    ("have you", "Yes"),
+    ("us citizen", "Yes"),
+    ("are you", "Yes"),
+    ("salary", "{salary}"),
+    ("can you", "Yes"),
+    ("gender", "Male"),
+    ("race", "Wish not to answer"),
+    ("lgbtq", "Wish not to answer"),
+    ("ethnicity", "Wish not to answer"),
+    ("nationality", "Wish not to answer"),
+    ("government", "I do not wish to self-identify"),
+    ("are you legally", "Yes"),
+]
+
+# words a near-duplicate question may add, drop or swap without changing what is asked
+STOPWORDS = frozenset("""
+a an the this that these those of in on at to for from with by about as into over
+is are was were be been being am do does did have has had will would can could should shall may might
+you your yours i me my we our us they them their it its he she his her
+what which who whom how when where why whether if or and but not no any some
+please kindly currently total overall
+""".split())
+
+# placeholder stored for questions nobody has answered yet
+UNANSWERED = "user provided"
+
+# {name} placeholders a rule answer may use
+VARIABLES = ('salary', 'rate')
+PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+
+def fill(answer: str, variables: dict) -> str:
+    """Substitute the known {name} placeholders, anything else in braces is left as written"""
+    return PLACEHOLDER.sub(lambda m: str(variables[m.group(1)]) if m.group(1) in variables else m.group(0),
+                           answer)
+
+
+def unknown_placeholders(answer) -> list:
+    """{name} placeholders in a rule answer that are not among VARIABLES"""
+    return [name for name in PLACEHOLDER.findall(str(answer)) if name not in VARIABLES]
+
+
+def normalize(question: str) -> str:
+    return " ".join(re.sub(r"[^\w\s]", " ", str(question).lower()).split())
+
+
+class QAEngine:
+    """Answers screening questions from known answers first, then rules.
+
+    Known answers (qa.csv) are indexed by normalized question text for exact
+    hits, plus a token inverted index used to find near-duplicates by Jaccard
+    similarity. A near-duplicate may only differ in STOPWORDS, so "... with
+    Java?" never answers "... with Python?". Rules are the ordered substring list from config. Recent
+    lookups are kept in a small LRU cache and new answers are handed to
+    `persist` in batches of `batch_size`.
+    """
+
+    def __init__(self, answers: dict | None = None, rules=None, variables: dict | None = None,
+                 similarity: float = 0.8, cache_size: int = 256, persist=None, batch_size: int = 10) -> None:
+        self.rules: list = [(normalize(match), str(answer)) for match, answer in (rules or DEFAULT_RULES)]
+        self.variables: dict = variables or {}
+        self.similarity = similarity
+        self.cache_size = cache_size
+        self.persist = persist
+        self.batch_size = batch_size
+        self.lock = threading.Lock()
+        self.answers: dict = {}
+        self.unanswered: set = set()
+        self.index: dict = {}
+        self.cache: OrderedDict = OrderedDict()
+        self.pending: list = []
+        for question, answer in (answers or {}).items():
+            self._index(question, answer)
+
+    @classmethod
+    def rules_from_config(cls, config) -> list | None:
+        """Turn `qa_rules: [{match: ..., answer: ...}]` into rule tuples"""
+        if not config:
+            return None
+        return [(rule['match'], rule['answer']) for rule in config]
+
+    def lookup(self, question: str) -> str | None:
+        key: str = normalize(question)
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                return self.cache[key]
+
+            answer: str | None = self.answers.get(key)
+            if answer is None:
+                answer = self._similar(key)
+            if answer is None:
+                answer = self._rule(key)
+
+            self.cache[key] = answer
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return answer
+
+    def add(self, question: str, answer) -> None:
+        """Remember an answer and queue it for persistence"""
+        with self.lock:
+            key: str = normalize(question)
+            if self.answers.get(key) == str(answer) or \
+                    (str(answer) == UNANSWERED and key in self.unanswered):
+                return
+            self._index(question, answer)
+            self.cache.pop(key, None)
+            self.pending.append((question, str(answer)))
+            due: bool = len(self.pending) >= self.batch_size
+        if due:
+            self.flush()
+
+    def known(self, question: str) -> bool:
+        key: str = normalize(question)
+        with self.lock:
+            return key in self.answers or key in self.unanswered
+
+    def flush(self) -> None:
+        with self.lock:
+            rows, self.pending = self.pending, []
+        if rows and self.persist is not None:
+            self.persist(rows)
+
+    def _index(self, question: str, answer) -> None:
+        key: str = normalize(question)
+        if str(answer) == UNANSWERED:
+            # keep the question on record but never offer the placeholder as an answer
+            self.unanswered.add(key)
+            return
+        self.answers[key] = str(answer)
+        for token in set(key.split()):
+            self.index.setdefault(token, set()).add(key)
+
+    def _similar(self, key: str) -> str | None:
+        tokens: set = set(key.split())
+        if not tokens:
+            return None
+        overlap: dict = {}
+        for token in tokens:
+            for candidate in self.index.get(token, ()):
+                overlap[candidate] = overlap.get(candidate, 0) + 1
+
+        best, best_score = None, 0.0
+        for candidate, shared in overlap.items():
+            candidate_tokens: set = set(candidate.split())
+            if not (tokens ^ candidate_tokens) <= STOPWORDS:
+                # a differing content word changes the question, whatever the overlap
+                continue
+            score: float = shared / (len(tokens) + len(candidate_tokens) - shared)
+            if score > best_score:
+                best, best_score = candidate, score
+        if best is not None and best_score >= self.similarity:
+            log.debug(f"Matched '{key}' to known question '{best}' ({best_score:.2f})")
+            return self.answers[best]
+        return None
+
+    def _rule(self, key: str) -> str | None:
+        padded: str = f" {key} "
+        for match, answer in self.rules:
+            # rules match whole words, "do you" does not fire on "do your"
+            if f" {match} " in padded:
+                return fill(answer, self.variables)
+        return None
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import csv
+import logging
+import os
+import threading
+from pathlib import Path
+
+from qa_engine import UNANSWERED, normalize
+
+log = logging.getLogger(__name__)
+
+HEADER = ["Question", "Answer"]
+
+
+class AnswerStore:
+    """Append-only CSV of screening questions and answers.
+
+    The file is read once with a streaming csv reader, new answers are
+    appended in batches, and `compact` rewrites it with one row per
+    normalized question when duplicates pile up.
+    """
+
+    def __init__(self, path="qa.csv") -> None:
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.rows: int = 0
+        if not self.path.is_file():
+            with open(self.path, 'w', newline='', encoding='utf-8') as f:
+                csv.writer(f).writerow(HEADER)
+
+    def load(self) -> dict:
+        """Question -> answer, later rows win over earlier ones"""
+        answers: dict = {}
+        self.rows = 0
+        with open(self.path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            for row in reader:
+                if len(row) < 2 or not row[0]:
+                    continue
+                self.rows += 1
+                answers[row[0]] = row[1]
+        return answers
+
+    def append(self, rows) -> None:
+        with self.lock:
+            with open(self.path, 'a', newline='', encoding='utf-8') as f:
+                csv.writer(f).writerows(rows)
+            self.rows += len(rows)
+
+    def compact(self, answers: dict | None = None) -> int:
+        """Rewrite the file with one row per normalized question, returns rows dropped"""
+        answers = self.load() if answers is None else answers
+        unique: dict = {}
+        for question, answer in answers.items():
+            key: str = normalize(question)
+            # a real answer always beats the placeholder
+            if key in unique and answer == UNANSWERED:
+                continue
+            unique[key] = (question, answer)
+
+        with self.lock:
+            tmp: Path = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(HEADER)
+                writer.writerows(unique.values())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+            dropped: int = self.rows - len(unique)
+            self.rows = len(unique)
+        log.info(f"Compacted {self.path}, {dropped} duplicate rows dropped")
+        return dropped
+
+    def compact_if_needed(self, answers: dict, ratio: float = 1.5) -> None:
+        if self.rows > 50 and self.rows > ratio * len({normalize(q) for q in answers}):
+            self.compact(answers)
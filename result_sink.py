@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import atexit
+import csv
+import json
+import logging
+import os
+import signal
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+COLUMNS = ['timestamp', 'jobID', 'job', 'company', 'attempted', 'result']
+
+
+class ResultSink:
+    """Buffered writer for the per-job result rows.
+
+    Rows are kept in memory and flushed once `flush_every` rows are queued or
+    `flush_interval` seconds have passed since the last flush. A daemon thread
+    enforces the interval while no rows arrive, so during long waits rows
+    never sit in memory much longer than `flush_interval`. The buffer is
+    also flushed at interpreter exit and on SIGTERM so a killed run does not
+    lose rows. Supported formats are csv (the historical output), jsonl and
+    parquet (requires pyarrow).
+    """
+
+    FORMATS = ('csv', 'jsonl', 'parquet')
+
+    def __init__(self, filename: str, format: str = 'csv', flush_every: int = 20,
+                 flush_interval: float = 30.0, fsync: bool = False) -> None:
+        if format not in self.FORMATS:
+            raise ValueError(f"Unsupported output format '{format}', expected one of {self.FORMATS}")
+        self.filename = filename
+        self.format = format
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.buffer: list = []
+        self.lock = threading.Lock()
+        self.last_flush: float = time.time()
+        self._parquet_writer = None
+        self._closed = threading.Event()
+        self._timer: threading.Thread | None = None
+        if flush_interval > 0:
+            self._timer = threading.Thread(target=self._flush_on_schedule, name="result-sink", daemon=True)
+            self._timer.start()
+
+        atexit.register(self.close)
+        if threading.current_thread() is threading.main_thread():
+            self._previous_sigterm = signal.signal(signal.SIGTERM, self._on_sigterm)
+
+    def write(self, row: list) -> None:
+        with self.lock:
+            self.buffer.append(row)
+            due: bool = len(self.buffer) >= self.flush_every or \
+                time.time() - self.last_flush >= self.flush_interval
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            rows, self.buffer = self.buffer, []
+            self.last_flush = time.time()
+            if not rows:
+                return
+            try:
+                getattr(self, f"_write_{self.format}")(rows)
+            except Exception:
+                # keep the rows so a later flush can retry them
+                self.buffer = rows + self.buffer
+                raise
+        log.debug(f"Flushed {len(rows)} rows to {self.filename}")
+
+    def close(self) -> None:
+        self._closed.set()
+        try:
+            self.flush()
+        except Exception as e:
+            log.error(f"Failed to flush results to {self.filename}: {e}")
+        with self.lock:
+            if self._parquet_writer is not None:
+                self._parquet_writer.close()
+                self._parquet_writer = None
+
+    def _flush_on_schedule(self) -> None:
+        while not self._closed.wait(min(1.0, self.flush_interval)):
+            with self.lock:
+                due: bool = bool(self.buffer) and time.time() - self.last_flush >= self.flush_interval
+            if not due:
+                continue
+            try:
+                self.flush()
+            except Exception as e:
+                log.error(f"Failed to flush results to {self.filename}: {e}")
+
+    def _on_sigterm(self, signum, frame) -> None:
+        self.close()
+        if callable(self._previous_sigterm):
+            self._previous_sigterm(signum, frame)
+        else:
+            raise SystemExit(128 + signum)
+
+    def _sync(self, f) -> None:
+        f.flush()
+        if self.fsync:
+            os.fsync(f.fileno())
+
+    def _write_csv(self, rows: list) -> None:
+        with open(self.filename, 'a+', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+            self._sync(f)
+
+    def _write_jsonl(self, rows: list) -> None:
+        with open(self.filename, 'a+', encoding='utf-8') as f:
+            for row in rows:
+                f.write(json.dumps(dict(zip(COLUMNS, row)), default=str) + '\n')
+            self._sync(f)
+
+    def _write_parquet(self, rows: list) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.table({column: [str(row[i]) if i < 4 else bool(row[i]) for row in rows]
+                          for i, column in enumerate(COLUMNS)})
+        if self._parquet_writer is None:
+            # parquet files cannot be appended to, so each run gets its own file
+            # and every flush becomes a row group
+            filename: str = self.filename
+            if os.path.exists(filename):
+                stem, ext = os.path.splitext(filename)
+                filename = f"{stem}_{time.strftime('%Y%m%d_%H%M%S')}{ext}"
+            self._parquet_writer = pq.ParquetWriter(filename, table.schema)
+        self._parquet_writer.write_table(table)
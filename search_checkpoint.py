@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+
+from atomic_file import write_json_atomic
+
+log = logging.getLogger(__name__)
+
+
+class SearchCheckpoint:
+    """Progress of every search combo, so a restarted run picks up where it stopped.
+
+    Holds the combo order of the run and, per combo, the offset of the next
+    result page, the job IDs of the current page not processed yet, the
+    search time used so far and whether the combo is exhausted. Each change
+    is written to `path` atomically; without a path progress is only kept in
+    memory. One instance is shared by every bot in the process. Once every
+    combo of the run is exhausted `finish()` removes the file, so the next
+    run starts a fresh search.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        data: dict = self._load()
+        self.search: list = data.get('search', [])
+        self.order: list = [tuple(combo) for combo in data.get('combos', [])]
+        self.combos: dict = data.get('state', {})
+        # key -> time.time() the combo's clock started at, minus the time used before
+        self.clocks: dict = {}
+
+    @staticmethod
+    def key(position, location) -> str:
+        return f"{position}\t{location}"
+
+    def plan(self, positions, locations, make_combos) -> list:
+        """The saved combo order when the search is unchanged, else `make_combos()` saved as the new order"""
+        search: list = [sorted(positions), sorted(locations)]
+        with self.lock:
+            if self.order and self.search == search:
+                done: int = sum(1 for combo in self.order if self._state(*combo)['exhausted'])
+                log.info(f"Resuming search from {self.path}, {done} of {len(self.order)} combos done")
+                return list(self.order)
+            self.search = search
+            self.order = [tuple(combo) for combo in make_combos()]
+            self.combos = {}
+            self._save()
+            return list(self.order)
+
+    def resume(self, position, location) -> dict:
+        """Saved progress of a combo, and start counting its search time again"""
+        with self.lock:
+            state: dict = self._state(position, location)
+            self.clocks[self.key(position, location)] = time.time() - state['elapsed']
+            return dict(state, queued=list(state['queued']))
+
+    def deadline(self, position, location, budget: float) -> float:
+        """time.time() at which the combo has used `budget` seconds over all runs"""
+        with self.lock:
+            return self.clocks.get(self.key(position, location), time.time()) + budget
+
+    def page(self, position, location, offset: int, queued) -> None:
+        """A page was handed out: searching goes on at `offset`, `queued` are still to be processed"""
+        self._update(position, location, offset=offset, queued=list(queued))
+
+    def processed(self, position, location, jobID) -> None:
+        with self.lock:
+            queued: list = self._state(position, location)['queued']
+            if jobID in queued:
+                queued.remove(jobID)
+            self._touch(position, location)
+
+    def exhaust(self, position, location) -> None:
+        self._update(position, location, exhausted=True, queued=[])
+
+    def is_exhausted(self, position, location) -> bool:
+        with self.lock:
+            return self._state(position, location)['exhausted']
+
+    def finish(self) -> None:
+        """Forget the run once all of its combos are exhausted"""
+        with self.lock:
+            if any(not self._state(*combo)['exhausted'] for combo in self.order):
+                return
+            self.order, self.combos, self.clocks = [], {}, {}
+            if self.path and os.path.exists(self.path):
+                os.remove(self.path)
+
+    def _state(self, position, location) -> dict:
+        return self.combos.setdefault(self.key(position, location),
+                                      {'offset': 0, 'exhausted': False, 'queued': [], 'elapsed': 0.0})
+
+    def _update(self, position, location, **changes) -> None:
+        with self.lock:
+            self._state(position, location).update(changes)
+            self._touch(position, location)
+
+    def _touch(self, position, location) -> None:
+        key: str = self.key(position, location)
+        if key in self.clocks:
+            self.combos[key]['elapsed'] = round(time.time() - self.clocks[key], 1)
+        self._save()
+
+    def _save(self) -> None:
+        if self.path:
+            write_json_atomic(self.path, {'search': self.search, 'combos': [list(combo) for combo in self.order],
+                                          'state': self.combos})
+
+    def _load(self) -> dict:
+        if not self.path or not os.path.isfile(self.path):
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable search checkpoint {self.path}: {e}")
+            return {}
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+
+from atomic_file import write_json_atomic
+
+log = logging.getLogger(__name__)
+
+# last outcome recorded for a job
+APPLIED = "applied"
+ALREADY_APPLIED = "already_applied"
+BLACKLISTED = "blacklisted"
+NO_EASY_APPLY = "no_easy_apply"
+FAILED = "failed"
+
+
+class SeenJobs:
+    """Run-wide cache of job IDs already handled, with the outcome of each.
+
+    Searches for different positions and locations overlap, so the same job
+    keeps coming back. Once it has been opened it is remembered here for
+    `ttl` seconds and skipped before its job page is loaded again. One
+    instance is shared by every bot in the process. With `path` set the
+    cache is written there every `save_every` new entries and on `save()`,
+    and loaded again by the next run.
+    """
+
+    def __init__(self, path: str | None = None, ttl: float = 86400, save_every: int = 20) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.save_every = save_every
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        # jobID -> (outcome, time recorded)
+        self.jobs: dict = self._load()
+        self.unsaved = 0
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.jobs)
+
+    def __contains__(self, jobID) -> bool:
+        return self.outcome(jobID) is not None
+
+    def outcome(self, jobID) -> str | None:
+        """Last outcome for jobID, None if it was not seen or has expired"""
+        with self.lock:
+            entry = self.jobs.get(str(jobID))
+            if entry is None:
+                return None
+            if time.time() - entry[1] > self.ttl:
+                del self.jobs[str(jobID)]
+                return None
+            return entry[0]
+
+    def record(self, jobID, outcome: str) -> None:
+        with self.lock:
+            self.jobs[str(jobID)] = (outcome, time.time())
+            self.unsaved += 1
+            due: bool = self.path is not None and self.unsaved >= self.save_every
+        if due:
+            self.save()
+
+    def counts(self) -> dict:
+        """Number of cached jobs per outcome"""
+        with self.lock:
+            counts: dict = {}
+            for outcome, _ in self.jobs.values():
+                counts[outcome] = counts.get(outcome, 0) + 1
+            return counts
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self.save_lock:
+            with self.lock:
+                now: float = time.time()
+                data: dict = {jobID: list(entry) for jobID, entry in self.jobs.items()
+                              if now - entry[1] <= self.ttl}
+                self.unsaved = 0
+            write_json_atomic(self.path, data)
+
+    def _load(self) -> dict:
+        if self.path is None:
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data: dict = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        now: float = time.time()
+        jobs: dict = {jobID: (outcome, recorded) for jobID, (outcome, recorded) in data.items()
+                      if now - recorded <= self.ttl}
+        log.info(f"{len(jobs)} seen jobs loaded from {self.path}")
+        return jobs
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import logging
+import threading
+
+log = logging.getLogger(__name__)
+
+# Returns [index, text] for the first selector with visible text, or null.
+PROBE_SCRIPT = """
+const selectors = arguments[0];
+for (let i = 0; i < selectors.length; i++) {
+    const el = document.querySelector(selectors[i]);
+    if (el && el.innerText && el.innerText.trim()) return [i, el.innerText.trim()];
+}
+return null;
+"""
+
+
+class SelectorResolver:
+    """Probes a list of candidate CSS selectors in a single script call.
+
+    The selector that matched last is moved to the front, so after LinkedIn
+    renames a class the working fallback is tried first from then on. Generic
+    `fallbacks` such as "h1" are always probed last and never promoted: they
+    also match unrelated elements while a page is still rendering.
+    """
+
+    def __init__(self, selectors, fallbacks=()) -> None:
+        self.selectors: list = list(selectors)
+        self.fallbacks: list = list(fallbacks)
+        self.lock = threading.Lock()
+
+    def probe(self, browser) -> str | None:
+        with self.lock:
+            selectors: list = list(self.selectors)
+        found = browser.execute_script(PROBE_SCRIPT, selectors + self.fallbacks)
+        if not found:
+            return None
+        index, text = found
+        if 0 < index < len(selectors):
+            with self.lock:
+                winner: str = selectors[index]
+                if winner in self.selectors:
+                    self.selectors.remove(winner)
+                    self.selectors.insert(0, winner)
+            log.debug(f"Selector '{winner}' promoted to first place")
+        return text
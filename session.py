@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from atomic_file import write_json_atomic
+
+log = logging.getLogger(__name__)
+
+# a static page on the LinkedIn domain, cookies can only be set for the current domain
+COOKIE_URL = "https://www.linkedin.com/robots.txt"
+CHECK_URL = "https://www.linkedin.com/feed/"
+LOGGED_OUT = ("/login", "/authwall", "/checkpoint", "/uas/", "signup")
+
+
+class SessionManager:
+    """Saves and restores the LinkedIn session between runs.
+
+    Cookies and localStorage are written to `path` after a successful login.
+    On startup they are put back into the browser and the session is checked
+    with a single navigation to the feed; only if that lands on a login page
+    does the bot fall back to typing credentials.
+    """
+
+    def __init__(self, path: str = "linkedin_session.json", max_age: float = 14 * 86400) -> None:
+        self.path = path
+        self.max_age = max_age
+
+    def save(self, browser) -> None:
+        try:
+            data: dict = {
+                "saved": time.time(),
+                "cookies": browser.get_cookies(),
+                "local_storage": browser.execute_script("return Object.assign({}, window.localStorage);") or {},
+            }
+        except Exception as e:
+            log.warning(f"Could not read session from browser: {e}")
+            return
+        # the file holds session cookies, keep it private
+        write_json_atomic(self.path, data, private=True)
+        log.info(f"Session saved to {self.path}")
+
+    def restore(self, browser) -> bool:
+        """Load the saved cookies and localStorage, False if there is nothing usable"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data: dict = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if time.time() - data.get("saved", 0) > self.max_age:
+            log.info("Saved session is too old, logging in again")
+            return False
+
+        browser.get(COOKIE_URL)
+        restored = 0
+        for cookie in data.get("cookies", []):
+            if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+                cookie.pop("sameSite", None)
+            try:
+                browser.add_cookie(cookie)
+                restored += 1
+            except Exception as e:
+                log.debug(f"Could not restore cookie {cookie.get('name')}: {e}")
+        if data.get("local_storage"):
+            browser.execute_script(
+                "for (const [k, v] of Object.entries(arguments[0])) window.localStorage.setItem(k, v);",
+                data["local_storage"])
+        log.info(f"Restored {restored} cookies from {self.path}")
+        return restored > 0
+
+    def is_valid(self, browser, timeout: float = 15) -> bool:
+        """One navigation to the feed, True if it was not redirected to a login page"""
+        browser.get(CHECK_URL)
+        try:
+            WebDriverWait(browser, timeout).until(
+                lambda d: d.execute_script("return document.readyState") == "complete")
+        except TimeoutException:
+            return False
+        url: str = browser.current_url
+        return "linkedin.com" in url and not any(part in url for part in LOGGED_OUT)
+
+    def clear(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import logging
+
+log = logging.getLogger(__name__)
+
+JOB_URL = "https://www.linkedin.com/jobs/view/{}"
+
+
+class TabPool:
+    """Job pages loading in background tabs while the bot works in the foreground one.
+
+    `preload(upcoming)` opens a background tab for each of the next `size`
+    jobs of the apply queue. Tabs are created with Target.createTarget, which
+    returns as soon as the tab exists, so the pages load while the current
+    form is being filled. `take(jobID)` closes the foreground tab and
+    switches to the job's tab, which by then has usually finished loading.
+    Works with both the Selenium and the cdp browser backend.
+    """
+
+    def __init__(self, browser, size: int = 2, metrics=None) -> None:
+        self.browser = browser
+        self.size = size
+        self.metrics = metrics
+        # jobID -> target id of its background tab, in preload order
+        self.tabs: dict = {}
+
+    def __len__(self) -> int:
+        return len(self.tabs)
+
+    def preload(self, upcoming, current=None) -> None:
+        """Keep tabs open for the first `size` jobs of `upcoming` and for `current`, and only those"""
+        wanted: list = [jobID for jobID in dict.fromkeys(upcoming) if jobID != current][:self.size]
+        for jobID in [jobID for jobID in self.tabs if jobID not in wanted and jobID != current]:
+            self.discard(jobID)
+        for jobID in wanted:
+            if jobID in self.tabs:
+                continue
+            try:
+                target: dict = self.browser.execute_cdp_cmd("Target.createTarget",
+                                                            {"url": JOB_URL.format(jobID), "background": True})
+            except Exception as e:
+                log.warning(f"Could not preload job {jobID}, loading it when its turn comes: {e}")
+                return
+            self.tabs[jobID] = target["targetId"]
+            self._inc('tabs:preloaded')
+
+    def take(self, jobID) -> bool:
+        """Make the preloaded tab of jobID the foreground tab, False if there is none"""
+        target_id: str | None = self.tabs.pop(jobID, None)
+        if target_id is None:
+            self._inc('tabs:miss')
+            return False
+        handle: str | None = next((h for h in self.browser.window_handles if h.endswith(target_id)), None)
+        if handle is None:
+            log.debug(f"Preloaded tab of job {jobID} is gone")
+            self._inc('tabs:miss')
+            return False
+        # the foreground tab holds the previous job, nothing comes back to it
+        self.browser.close()
+        self.browser.switch_to.window(handle)
+        self._inc('tabs:hit')
+        return True
+
+    def discard(self, jobID) -> None:
+        """Close the tab of a job that will not be applied to"""
+        target_id: str | None = self.tabs.pop(jobID, None)
+        if target_id is None:
+            return
+        self._close(target_id)
+        self._inc('tabs:discarded')
+
+    def clear(self) -> None:
+        for jobID in list(self.tabs):
+            self.discard(jobID)
+
+    def _close(self, target_id: str) -> None:
+        try:
+            self.browser.execute_cdp_cmd("Target.closeTarget", {"targetId": target_id})
+        except Exception as e:
+            log.debug(f"Could not close tab {target_id}: {e}")
+
+    def _inc(self, name: str) -> None:
+        if self.metrics is not None:
+            self.metrics.inc(name)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import logging
+import re
+
+log = logging.getLogger(__name__)
+
+# used when neither blacklist keywords nor title patterns are configured
+DEFAULT_KEYWORDS = ['senior', 'java', 'oracle', 'scientist', 'promoted']
+DEFAULT_PATTERNS = [
+    r'hiring\s*(immediately|urgently)',
+    r'0?\s*experience\s*required',
+]
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over lower-cased keywords.
+
+    A title is scanned once regardless of how many keywords are loaded.
+    Matches only count on word boundaries, mirroring `\\bkeyword\\b`.
+    """
+
+    def __init__(self, keywords) -> None:
+        self.goto: list = [{}]
+        self.fail: list = [0]
+        self.output: list = [[]]
+        for keyword in keywords:
+            self._add(keyword.lower())
+        self._build()
+
+    def __bool__(self) -> bool:
+        return len(self.goto) > 1
+
+    def _add(self, keyword: str) -> None:
+        state = 0
+        for char in keyword:
+            if char not in self.goto[state]:
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+                self.goto[state][char] = len(self.goto) - 1
+            state = self.goto[state][char]
+        self.output[state].append(keyword)
+
+    def _build(self) -> None:
+        queue: list = list(self.goto[0].values())
+        for state in queue:
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def search(self, text: str) -> str | None:
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword in output[state]:
+                start = end - len(keyword) + 1
+                if (start == 0 or not text[start - 1].isalnum()) and \
+                        (end + 1 == len(text) or not text[end + 1].isalnum()):
+                    return keyword
+        return None
+
+
+class TitleFilter:
+    """Blacklist matcher built once from config.
+
+    Plain keywords go into a single Aho-Corasick automaton and regex patterns
+    are compiled into one case-insensitive alternation, so the cost of a
+    lookup does not grow with the number of configured entries.
+    """
+
+    def __init__(self, keywords=None, patterns=None) -> None:
+        keywords = [k for k in (keywords or []) if k]
+        patterns = [p for p in (patterns or []) if p]
+        if not keywords and not patterns:
+            keywords, patterns = DEFAULT_KEYWORDS, DEFAULT_PATTERNS
+
+        self.automaton = KeywordAutomaton(keywords)
+        self.regex = re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE) if patterns else None
+        log.debug(f"Title filter built from {len(keywords)} keywords and {len(patterns)} patterns")
+
+    def match(self, title: str) -> str | None:
+        """Return the blacklisted term found in title, or None"""
+        if not title:
+            return None
+        keyword = self.automaton.search(title.lower()) if self.automaton else None
+        if keyword is not None:
+            return keyword
+        if self.regex is not None:
+            found = self.regex.search(title)
+            if found:
+                return found.group(0)
+        return None
+
+    def match_many(self, titles) -> list:
+        return [self.match(title) for title in titles]
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import logging
+import random
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+log = logging.getLogger(__name__)
+
+# Resolves once the DOM has not changed for quietMs, or after timeoutMs.
+QUIET_SCRIPT = """
+const [quietMs, timeoutMs, done] = arguments;
+const start = Date.now();
+let timer, limit;
+const observer = new MutationObserver(() => {
+    clearTimeout(timer);
+    timer = setTimeout(finish, quietMs);
+});
+function finish() {
+    observer.disconnect();
+    clearTimeout(timer);
+    clearTimeout(limit);
+    done(Date.now() - start < timeoutMs);
+}
+observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+timer = setTimeout(finish, quietMs);
+limit = setTimeout(finish, timeoutMs);
+"""
+
+# Resolves once no new resource has finished loading for idleMs, or after timeoutMs.
+NETWORK_IDLE_SCRIPT = """
+const [idleMs, timeoutMs, done] = arguments;
+const start = Date.now();
+let timer, limit;
+const observer = new PerformanceObserver(() => {
+    clearTimeout(timer);
+    timer = setTimeout(finish, idleMs);
+});
+function finish() {
+    observer.disconnect();
+    clearTimeout(timer);
+    clearTimeout(limit);
+    done(Date.now() - start < timeoutMs);
+}
+observer.observe({type: 'resource', buffered: false});
+timer = setTimeout(finish, idleMs);
+limit = setTimeout(finish, timeoutMs);
+"""
+
+# Scrolls the nearest scrollable ancestor of the first `itemSelector` match one
+# screen at a time. Each step waits up to settleMs for new items, observed with
+# a MutationObserver, and it resolves with [count, complete] once the list is
+# scrolled to the bottom and no new items arrived, or after timeoutMs.
+SCROLL_SCRIPT = """
+const [itemSelector, containerSelector, settleMs, timeoutMs, done] = arguments;
+const count = () => document.querySelectorAll(itemSelector).length;
+function box() {
+    let node = containerSelector ? document.querySelector(containerSelector) : document.querySelector(itemSelector);
+    while (node && node !== document.body) {
+        const overflow = getComputedStyle(node).overflowY;
+        if (node.scrollHeight > node.clientHeight && (overflow === 'auto' || overflow === 'scroll')) return node;
+        node = node.parentElement;
+    }
+    return document.scrollingElement;
+}
+let last = -1, timer, limit;
+const observer = new MutationObserver(() => { if (count() > last) step(); });
+function finish(complete) {
+    observer.disconnect();
+    clearTimeout(timer);
+    clearTimeout(limit);
+    done([count(), complete]);
+}
+function step() {
+    clearTimeout(timer);
+    last = count();
+    const container = box();
+    container.scrollBy(0, container.clientHeight);
+    timer = setTimeout(() => {
+        const bottom = container.scrollTop + container.clientHeight >= container.scrollHeight - 2;
+        if (bottom && count() <= last) finish(true); else step();
+    }, settleMs);
+}
+observer.observe(document.body, {childList: true, subtree: true});
+limit = setTimeout(() => finish(false), timeoutMs);
+step();
+"""
+
+
+class JitterPolicy:
+    """Optional human-like pause added after every wait"""
+
+    def __init__(self, min_sec: float = 0.0, max_sec: float = 0.0) -> None:
+        self.min_sec = min_sec
+        self.max_sec = max(min_sec, max_sec)
+
+    def pause(self) -> float:
+        if self.max_sec <= 0:
+            return 0.0
+        delay: float = random.uniform(self.min_sec, self.max_sec)
+        time.sleep(delay)
+        return delay
+
+
+class Waiter:
+    """Condition-based waits used in place of fixed sleeps.
+
+    Every call is tagged with a call site name and the time actually spent
+    waiting there (including jitter) is accumulated in `stats`, so the effect
+    of tuning a wait can be measured per site.
+    """
+
+    def __init__(self, browser, timeout: float = 10, poll: float = 0.1, jitter: JitterPolicy | None = None) -> None:
+        self.browser = browser
+        self.timeout = timeout
+        self.poll = poll
+        self.jitter = jitter or JitterPolicy()
+        self.stats: dict = {}
+        # async scripts are bounded by their own timeoutMs argument
+        self.browser.set_script_timeout(timeout + 5)
+
+    def clickable(self, site: str, target, timeout: float | None = None):
+        """Wait for a locator tuple or WebElement to become clickable"""
+        return self._until(site, EC.element_to_be_clickable(target), timeout)
+
+    def present(self, site: str, locator, timeout: float | None = None):
+        return self._until(site, EC.presence_of_element_located(locator), timeout)
+
+    def absent(self, site: str, locator, timeout: float | None = None) -> bool:
+        return self._until(site, lambda d: len(d.find_elements(*locator)) == 0, timeout) is not None
+
+    def until(self, site: str, condition, timeout: float | None = None):
+        return self._until(site, condition, timeout)
+
+    def quiet(self, site: str, quiet: float = 0.5, timeout: float | None = None) -> bool:
+        """Wait for DOM mutation quiescence"""
+        return self._script(site, QUIET_SCRIPT, quiet, timeout)
+
+    def network_idle(self, site: str, idle: float = 0.5, timeout: float | None = None) -> bool:
+        """Wait until no new resources have finished loading for `idle` seconds"""
+        return self._script(site, NETWORK_IDLE_SCRIPT, idle, timeout)
+
+    def scroll(self, site: str, items: str, container: str | None = None,
+               settle: float = 0.3, timeout: float | None = None) -> int:
+        """Scroll the list holding `items` until no new ones load, returns how many there are"""
+        start: float = time.time()
+        try:
+            count, complete = self.browser.execute_async_script(SCROLL_SCRIPT, items, container, int(settle * 1000),
+                                                                int((timeout or self.timeout) * 1000))
+            if not complete:
+                log.debug(f"wait {site} timed out with {count} items loaded")
+            return count
+        except Exception as e:
+            log.debug(f"wait {site} failed: {e}")
+            return 0
+        finally:
+            self._finish(site, start)
+
+    def record(self, site: str, elapsed: float) -> None:
+        calls, total = self.stats.get(site, (0, 0.0))
+        self.stats[site] = (calls + 1, total + elapsed)
+
+    def summary(self) -> None:
+        for site, (calls, total) in sorted(self.stats.items(), key=lambda item: -item[1][1]):
+            log.info(f"wait {site}: {calls} calls, {total:.1f}s total, {total / calls:.2f}s avg")
+
+    def _until(self, site: str, condition, timeout: float | None):
+        start: float = time.time()
+        try:
+            return WebDriverWait(self.browser, timeout or self.timeout, poll_frequency=self.poll).until(condition)
+        except TimeoutException:
+            log.debug(f"wait {site} timed out")
+            return None
+        finally:
+            self._finish(site, start)
+
+    def _script(self, site: str, script: str, settle: float, timeout: float | None) -> bool:
+        start: float = time.time()
+        try:
+            return bool(self.browser.execute_async_script(script, int(settle * 1000),
+                                                          int((timeout or self.timeout) * 1000)))
+        except Exception as e:
+            log.debug(f"wait {site} failed: {e}")
+            return False
+        finally:
+            self._finish(site, start)
+
+    def _finish(self, site: str, start: float) -> None:
+        self.jitter.pause()
+        self.record(site, time.time() - start)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Token bucket shared by all workers, `rate` applications per hour"""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.interval: float = 3600.0 / rate if rate else 0.0
+        self.capacity: int = max(1, burst)
+        self.tokens: float = float(self.capacity)
+        self.updated: float = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if not self.interval:
+            return
+        while True:
+            with self.lock:
+                now: float = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) / self.interval)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay: float = (1 - self.tokens) * self.interval
+            time.sleep(delay)
+
+
+class WorkerPool:
+    """Runs search combos on N browsers in parallel.
+
+    Combos go on a shared queue and every worker owns one bot built by
+    `bot_factory(index)`, with its own WebDriver and profile directory. The
+    factory is expected to hand all bots the same AppliedStore, ResultSink
+    and RateLimiter so results land in one file and a jobID is only ever
+    claimed by one worker.
+    """
+
+    def __init__(self, bot_factory, size: int = 2) -> None:
+        self.bot_factory = bot_factory
+        self.size = size
+        self.combos: queue.Queue = queue.Queue()
+
+    def run(self, combos, days_old=3, distance=8) -> None:
+        for combo in combos:
+            self.combos.put(combo)
+
+        workers: list = [threading.Thread(target=self._work, args=(index, days_old, distance),
+                                          name=f"worker-{index}", daemon=True)
+                         for index in range(self.size)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    def _work(self, index: int, days_old, distance) -> None:
+        try:
+            bot = self.bot_factory(index)
+        except Exception as e:
+            log.error(f"Worker {index} could not start: {e}")
+            return
+
+        try:
+            bot.fill_data()
+            while True:
+                try:
+                    position, location = self.combos.get_nowait()
+                except queue.Empty:
+                    break
+                log.info(f"[worker {index}] Applying to {position}: {location}")
+                try:
+                    bot.run_combo(position, location, days_old, distance)
+                except Exception as e:
+                    log.error(f"[worker {index}] {position}: {location} failed: {e}")
+                finally:
+                    self.combos.task_done()
+        finally:
+            # answers are written in batches, the last one is still pending
+            bot.qa.flush()
+            if bot.discovery is not None:
+                bot.discovery.browser.quit()
+            bot.browser.quit()